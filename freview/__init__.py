@@ -10,13 +10,21 @@ __version__ = "2.0.0"
 __author__ = "Benard Ronoh"
 __email__ = "ronohbenard48@gmail.com"
 
-from .project_analyzer import analyze_project_structure
-from .model_checker import analyze_models
-from .api_analyzer import analyze_api_patterns
-from .database_analyzer import analyze_database_patterns
-from .utils import write_markdown_report, write_json_report
-from .config import ReviewConfig, load_config
-from .cli import app as cli_app
+import importlib
+
+# Public names and the submodule attribute they resolve to. Submodules are only
+# imported on first access (PEP 562) to keep CLI startup cheap.
+_LAZY_ATTRIBUTES = {
+    "analyze_project_structure": ("project_analyzer", "analyze_project_structure"),
+    "analyze_models": ("model_checker", "analyze_models"),
+    "analyze_api_patterns": ("api_analyzer", "analyze_api_patterns"),
+    "analyze_database_patterns": ("database_analyzer", "analyze_database_patterns"),
+    "write_markdown_report": ("utils", "write_markdown_report"),
+    "write_json_report": ("utils", "write_json_report"),
+    "ReviewConfig": ("config", "ReviewConfig"),
+    "load_config": ("config", "load_config"),
+    "cli_app": ("cli", "app"),
+}
 
 __all__ = [
     "analyze_project_structure",
@@ -29,3 +37,20 @@ __all__ = [
     "load_config",
     "cli_app",
 ]
+
+
+def __getattr__(name):
+    """Import public names from their submodules on first access."""
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
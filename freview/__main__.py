@@ -0,0 +1,27 @@
+"""
+Command-line entry point for freview.
+
+Handles ``freview --version`` without importing typer or rich, and hands
+every other invocation to the full Typer application.
+"""
+
+import sys
+
+_VERSION_FLAGS = frozenset({"--version", "-V"})
+
+
+def main() -> None:
+    """Run the freview command line."""
+    if len(sys.argv) == 2 and sys.argv[1] in _VERSION_FLAGS:
+        from freview import __version__
+
+        print(f"freview version {__version__}")
+        return
+
+    from freview.cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Shared AST parsing and traversal for freview analyzers.
+
+The API, model and database analyzers often look at the same files during a
+single review. Parsing through this module means each file is parsed once and
+the resulting tree is shared between them. Analyzers can also register their
+visitors as observers so a file is walked once with all of them attached.
+
+An observer is any object exposing ``visit_<NodeType>(node)`` hooks, called
+when the walk enters a node, and optionally ``leave_<NodeType>(node)`` hooks,
+called once all of the node's children have been visited. Hooks must not
+recurse into children themselves.
+
+An observer may also define ``wants_expressions()``. While it returns False
+the walk may skip expressions for that observer and only descend through
+nested statements. Expressions are walked whenever any observer without the
+method is attached, or while any observer's method returns True.
+"""
+
+import ast
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+# Observer factories registered by the analyzers, keyed by analyzer name
+_OBSERVER_FACTORIES: Dict[str, Callable[[Path], Any]] = {}
+
+# Fields holding nested statements; without expressions only these are walked
+_STATEMENT_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+# Enter hooks, leave hooks, all child fields and statement fields for one node class
+_NodePlan = Tuple[List[Callable], List[Callable], Tuple[str, ...], Tuple[str, ...]]
+
+
+class CompositeVisitor:
+    """Walk a tree once, dispatching every node to all registered observers."""
+
+    def __init__(self, observers: Sequence[Any]):
+        self.observers = list(observers)
+        self._plans: Dict[type, _NodePlan] = {}
+        checks: List[Callable[[], bool]] = [
+            observer.wants_expressions
+            for observer in self.observers
+            if hasattr(observer, "wants_expressions")
+        ]
+        # None when some observer always needs expressions, so no check is made
+        self._expression_checks = checks if len(checks) == len(self.observers) else None
+
+    def _plan_for(self, node_type: type) -> _NodePlan:
+        """Resolve the observers' hooks and the child fields for a node type once."""
+        name = node_type.__name__
+        enter = []
+        leave = []
+        for observer in self.observers:
+            hook = getattr(observer, f"visit_{name}", None)
+            if hook is not None:
+                enter.append(hook)
+            hook = getattr(observer, f"leave_{name}", None)
+            if hook is not None:
+                leave.append(hook)
+        fields: Tuple[str, ...] = tuple(getattr(node_type, "_fields", ()))
+        statement_fields = tuple(f for f in fields if f in _STATEMENT_FIELDS)
+        plan = (enter, leave, fields, statement_fields)
+        self._plans[node_type] = plan
+        return plan
+
+    def visit(self, tree: ast.AST) -> None:
+        """Walk the tree depth-first in source order."""
+        plans = self._plans
+        checks = self._expression_checks
+        stack: List[Tuple[ast.AST, bool]] = [(tree, False)]
+        while stack:
+            node, leaving = stack.pop()
+            enter, leave, fields, statement_fields = (
+                plans.get(type(node)) or self._plan_for(type(node))
+            )
+            if leaving:
+                for hook in leave:
+                    hook(node)
+                continue
+
+            for hook in enter:
+                hook(node)
+            if leave:
+                stack.append((node, True))
+
+            if checks is not None and not any(check() for check in checks):
+                fields = statement_fields
+            children: List[ast.AST] = []
+            for field_name in fields:
+                value = getattr(node, field_name, None)
+                if isinstance(value, list):
+                    children.extend(item for item in value if isinstance(item, ast.AST))
+                elif isinstance(value, ast.AST):
+                    children.append(value)
+            children.reverse()
+            stack.extend((child, False) for child in children)
+
+
+def register_observer(name: str, factory: Callable[[Path], Any]) -> None:
+    """Register a visitor factory to be attached to shared file walks."""
+    _OBSERVER_FACTORIES[name] = factory
+
+
+def file_observers(path: Path) -> Dict[str, Any]:
+    """
+    Walk a file once with every registered observer attached.
+
+    Results are cached like parsed trees, so each analyzer picks its own
+    observer from the same walk. Observers are shared and must be treated as
+    read-only once returned.
+
+    Raises:
+        OSError: If the file cannot be read
+        SyntaxError: If the file is not valid Python (including undecodable source)
+    """
+    stat = os.stat(path)
+    return _walk(path, stat.st_mtime_ns, stat.st_size, tuple(_OBSERVER_FACTORIES))
+
+
+@lru_cache(maxsize=1024)
+def _walk(path: Path, mtime_ns: int, size: int, names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Build the registered observers for a file and run them in one walk."""
+    tree = _parse(path, mtime_ns, size)
+    observers = {name: _OBSERVER_FACTORIES[name](path) for name in names}
+    CompositeVisitor(list(observers.values())).visit(tree)
+    return observers
+
+
+def parsed_tree(path: Path) -> ast.Module:
+    """
+    Parse a Python file, reusing the tree from earlier calls.
+
+    Cached trees are keyed on the file's modification time and size as well as
+    its path, so edits made between calls are picked up. Trees are shared and
+    must not be modified by callers.
+
+    Raises:
+        OSError: If the file cannot be read
+        SyntaxError: If the file is not valid Python (including undecodable source)
+    """
+    stat = os.stat(path)
+    return _parse(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _parse(path: Path, mtime_ns: int, size: int) -> ast.Module:
+    """Parse a file from bytes so ast.parse handles the source encoding."""
+    return ast.parse(_read(path, mtime_ns, size), filename=str(path))
+
+
+def source_bytes(path: Path) -> bytes:
+    """
+    Read a file's raw bytes, shared with later parses of the same file.
+
+    Lets analyzers run cheap byte-level checks before deciding to parse
+    without reading the file twice.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    stat = os.stat(path)
+    return _read(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _read(path: Path, mtime_ns: int, size: int) -> bytes:
+    """Read a file's bytes for a given modification time and size."""
+    return path.read_bytes()
+
+
+def clear_caches() -> None:
+    """Drop all cached file contents, trees and observer walks."""
+    _read.cache_clear()
+    _parse.cache_clear()
+    _walk.cache_clear()
+
+
+def is_decode_error(error: SyntaxError) -> bool:
+    """Check whether a SyntaxError from parsing bytes came from decoding the source."""
+    return bool(error.msg) and error.msg.startswith("(unicode error)")
@@ -7,12 +7,62 @@ potential issues and suggest improvements.
 
 import ast
 import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, FrozenSet, List, Set, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 
+from ._ast_cache import CompositeVisitor, file_observers, register_observer, source_bytes
+from .config import iter_py_files
 
-@dataclass
+# Route files above this size are skipped rather than parsed
+_MAX_ROUTE_FILE_SIZE = 1024 * 1024
+
+
+# Basic REST patterns and the methods they are expected to use
+_REST_PATTERNS = [
+    (re.compile(r"/api/\w+/?$"), frozenset({"GET", "POST"})),  # Collection
+    (re.compile(r"/api/\w+/\d+/?$"), frozenset({"GET", "PUT", "DELETE"})),  # Resource
+    (re.compile(r"/api/\w+/<\w+>/?$"), frozenset({"GET", "PUT", "DELETE"})),  # Variable resource
+]
+
+_VERSION_RE = re.compile(r"/v\d+/")
+
+# HTTP methods that modify data and so should validate their input
+_DATA_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Decorator attributes that register a route, e.g. @app.route or @bp.get
+_ROUTE_DECORATOR_ATTRS = frozenset({"route", "get", "post", "put", "delete", "patch"})
+
+# Per decorator node class: the field holding its name and the route names
+_ROUTE_DECORATOR_SHAPE = {
+    ast.Attribute: ("attr", _ROUTE_DECORATOR_ATTRS),
+    ast.Name: ("id", frozenset({"route"})),
+}
+
+# Call names hinting at input validation and authentication
+_VALIDATION_RE = re.compile(r"validate|check|verify|parse_args|get_json", re.IGNORECASE)
+_AUTH_RE = re.compile(
+    r"login_required|auth|authenticate|check_token|verify_token", re.IGNORECASE
+)
+
+# Keywords in a route path or function name marking sensitive operations
+_SENSITIVE_RE = re.compile(
+    r"delete|remove|admin|user|auth|login|password|create|update|edit|modify"
+)
+
+# Route file names matched anywhere in the project
+_ROUTE_FILE_RE = re.compile(r"(?:.*views|routes.*|api.*|blueprint.*|endpoints.*)\.py\Z")
+
+# Entry point files only considered at the project root
+_ROOT_ROUTE_FILES = frozenset({"app.py", "main.py", "application.py"})
+
+# Top-level directories whose Python files are all route candidates
+_ROUTE_DIRS = frozenset({"views", "routes", "api", "blueprints", "endpoints"})
+
+
+@dataclass(slots=True)
 class RouteInfo:
     """Information about a Flask route."""
     
@@ -26,10 +76,20 @@ class RouteInfo:
     has_input_validation: bool = False
     has_authentication: bool = False
     line_number: int = 0
-    decorators: List[str] = field(default_factory=list)
+    decorator_nodes: List[ast.expr] = field(default_factory=list)
+    
+    @property
+    def method_set(self) -> FrozenSet[str]:
+        """Set view of methods for membership checks, always in step with methods."""
+        return frozenset(self.methods)
+    
+    @property
+    def decorators(self) -> List[str]:
+        """The route's decorators rendered as strings, built on access."""
+        return [_decorator_to_string(d) for d in self.decorator_nodes]
 
 
-@dataclass
+@dataclass(slots=True)
 class BlueprintInfo:
     """Information about a Flask blueprint."""
     
@@ -39,58 +99,97 @@ class BlueprintInfo:
     file_path: Optional[Path] = None
 
 
-class APIVisitor(ast.NodeVisitor):
-    """AST visitor for analyzing Flask API patterns."""
+class APIVisitor:
+    """
+    AST observer for analyzing Flask API patterns.
+
+    Hooks follow the observer protocol in ``freview._ast_cache`` so the visitor
+    can share a walk with the other analyzers; ``visit`` runs it on its own.
+    """
     
     def __init__(self, file_path: Path):
         self.file_path = file_path
         self.routes: List[RouteInfo] = []
         self.blueprints: List[BlueprintInfo] = []
         self.imports: Set[str] = set()
+        self.has_flask_import = False
         self.current_class = None
         self.current_blueprint = None
+        self._route_stack: List[Tuple[ast.AST, RouteInfo]] = []
+    
+    def visit(self, tree):
+        """Walk a tree with only this visitor attached."""
+        CompositeVisitor([self]).visit(tree)
+    
+    def wants_expressions(self):
+        """Calls only matter inside route bodies; elsewhere only statements are walked."""
+        return bool(self._route_stack)
     
     def visit_Import(self, node):
         """Track imports to understand Flask usage."""
         for alias in node.names:
             self.imports.add(alias.name)
-        self.generic_visit(node)
+            if "flask" in alias.name.lower():
+                self.has_flask_import = True
     
     def visit_ImportFrom(self, node):
         """Track from imports."""
         if node.module:
             for alias in node.names:
-                self.imports.add(f"{node.module}.{alias.name}")
-        self.generic_visit(node)
+                name = f"{node.module}.{alias.name}"
+                self.imports.add(name)
+                if "flask" in name.lower():
+                    self.has_flask_import = True
     
     def visit_Assign(self, node):
         """Look for blueprint assignments."""
         if isinstance(node.value, ast.Call):
             if self._is_blueprint_call(node.value):
                 self._extract_blueprint_info(node)
-        self.generic_visit(node)
     
     def visit_FunctionDef(self, node):
         """Analyze function definitions for routes."""
         route_info = self._extract_route_info(node)
         if route_info:
             self.routes.append(route_info)
-        self.generic_visit(node)
+            # The body is visited next; visit_Try/visit_Call flag patterns on
+            # the route at the top of the stack until leave_FunctionDef
+            self._route_stack.append((node, route_info))
+    
+    def leave_FunctionDef(self, node):
+        """Close the route scope opened by visit_FunctionDef."""
+        if self._route_stack and self._route_stack[-1][0] is node:
+            self._route_stack.pop()
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    leave_AsyncFunctionDef = leave_FunctionDef
+    
+    def visit_Try(self, node):
+        """Track error handling inside route functions."""
+        if self._route_stack:
+            self._route_stack[-1][1].has_error_handling = True
+    
+    def visit_Call(self, node):
+        """Track validation and authentication calls inside route functions."""
+        if self._route_stack:
+            route_info = self._route_stack[-1][1]
+            # Look for validation patterns
+            if self._is_validation_call(node):
+                route_info.has_input_validation = True
+            # Look for authentication patterns
+            if self._is_auth_call(node):
+                route_info.has_authentication = True
     
     def _is_blueprint_call(self, call: ast.Call) -> bool:
         """Check if a call creates a Flask Blueprint."""
-        if isinstance(call.func, ast.Name):
-            return call.func.id == "Blueprint"
-        elif isinstance(call.func, ast.Attribute):
-            return call.func.attr == "Blueprint"
-        return False
+        return _call_func_name(call) == "Blueprint"
     
     def _extract_blueprint_info(self, node: ast.Assign):
         """Extract blueprint information from assignment."""
-        if not isinstance(node.value, ast.Call):
+        call = node.value
+        if not isinstance(call, ast.Call):
             return
         
-        call = node.value
         blueprint_name = None
         url_prefix = None
         
@@ -114,12 +213,11 @@ class APIVisitor(ast.NodeVisitor):
     
     def _extract_route_info(self, node: ast.FunctionDef) -> Optional[RouteInfo]:
         """Extract route information from a function definition."""
-        route_decorators = self._find_route_decorators(node.decorator_list)
-        if not route_decorators:
+        # Only the primary (first) route decorator is used
+        route_decorator = self._first_route_decorator(node.decorator_list)
+        if route_decorator is None:
             return None
         
-        # Get the primary route decorator
-        route_decorator = route_decorators[0]
         path, methods = self._parse_route_decorator(route_decorator)
         
         route_info = RouteInfo(
@@ -128,47 +226,38 @@ class APIVisitor(ast.NodeVisitor):
             methods=methods,
             function_name=node.name,
             blueprint=self.current_blueprint,
-            has_docstring=ast.get_docstring(node) is not None,
+            has_docstring=_has_docstring(node),
             line_number=node.lineno,
-            decorators=[self._decorator_to_string(d) for d in node.decorator_list]
+            decorator_nodes=list(node.decorator_list)
         )
         
-        # Analyze function body for patterns
-        self._analyze_route_body(node, route_info)
-        
         return route_info
     
-    def _find_route_decorators(self, decorators: List[ast.expr]) -> List[ast.expr]:
-        """Find route-related decorators."""
-        route_decorators = []
-        
+    def _first_route_decorator(self, decorators: List[ast.expr]) -> Optional[ast.expr]:
+        """Find the first route-related decorator, if any."""
         for decorator in decorators:
             if self._is_route_decorator(decorator):
-                route_decorators.append(decorator)
-        
-        return route_decorators
+                return decorator
+        return None
     
     def _is_route_decorator(self, decorator: ast.expr) -> bool:
         """Check if a decorator is a route decorator."""
-        if isinstance(decorator, ast.Name):
-            return decorator.id in ["route"]
-        elif isinstance(decorator, ast.Attribute):
-            return decorator.attr in ["route", "get", "post", "put", "delete", "patch"]
-        elif isinstance(decorator, ast.Call):
-            if isinstance(decorator.func, ast.Name):
-                return decorator.func.id in ["route"]
-            elif isinstance(decorator.func, ast.Attribute):
-                return decorator.func.attr in ["route", "get", "post", "put", "delete", "patch"]
-        return False
+        # @app.route("/path") and bare @app.route are classified by the callee
+        target = decorator.func if type(decorator) is ast.Call else decorator
+        shape = _ROUTE_DECORATOR_SHAPE.get(type(target))
+        if shape is None:
+            return False
+        name_field, route_names = shape
+        return getattr(target, name_field) in route_names
     
     def _parse_route_decorator(self, decorator: ast.expr) -> Tuple[str, List[str]]:
         """Parse route decorator to extract path and methods."""
         path = "/"
         methods = ["GET"]
         
-        if isinstance(decorator, ast.Call):
+        if type(decorator) is ast.Call:
             # Get path from first argument
-            if decorator.args and isinstance(decorator.args[0], ast.Constant):
+            if decorator.args and type(decorator.args[0]) is ast.Constant:
                 path = decorator.args[0].value
             
             # Get methods from keywords
@@ -177,71 +266,70 @@ class APIVisitor(ast.NodeVisitor):
                     if isinstance(keyword.value, ast.List):
                         methods = []
                         for elt in keyword.value.elts:
-                            if isinstance(elt, ast.Constant):
-                                methods.append(elt.value)
+                            if type(elt) is ast.Constant and type(elt.value) is str:
+                                # Interned so all routes share the few verb strings
+                                methods.append(sys.intern(elt.value.upper()))
         
         return path, methods
     
-    def _analyze_route_body(self, node: ast.FunctionDef, route_info: RouteInfo):
-        """Analyze the route function body for patterns."""
-        # Look for error handling patterns
-        for stmt in ast.walk(node):
-            if isinstance(stmt, ast.Try):
-                route_info.has_error_handling = True
-            elif isinstance(stmt, ast.Call):
-                # Look for validation patterns
-                if self._is_validation_call(stmt):
-                    route_info.has_input_validation = True
-                # Look for authentication patterns
-                if self._is_auth_call(stmt):
-                    route_info.has_authentication = True
-    
     def _is_validation_call(self, call: ast.Call) -> bool:
         """Check if a call represents input validation."""
-        validation_patterns = [
-            "validate", "check", "verify", "parse_args", "get_json"
-        ]
-        
-        if isinstance(call.func, ast.Attribute):
-            return any(pattern in call.func.attr.lower() for pattern in validation_patterns)
-        elif isinstance(call.func, ast.Name):
-            return any(pattern in call.func.id.lower() for pattern in validation_patterns)
-        
-        return False
+        name = _call_func_name(call)
+        return name is not None and _VALIDATION_RE.search(name) is not None
     
     def _is_auth_call(self, call: ast.Call) -> bool:
         """Check if a call represents authentication."""
-        auth_patterns = [
-            "login_required", "auth", "authenticate", "check_token", "verify_token"
-        ]
-        
-        if isinstance(call.func, ast.Attribute):
-            return any(pattern in call.func.attr.lower() for pattern in auth_patterns)
-        elif isinstance(call.func, ast.Name):
-            return any(pattern in call.func.id.lower() for pattern in auth_patterns)
-        
+        name = _call_func_name(call)
+        return name is not None and _AUTH_RE.search(name) is not None
+
+
+register_observer("api", APIVisitor)
+
+
+def _decorator_to_string(decorator: ast.expr) -> str:
+    """Convert decorator AST to string representation."""
+    if isinstance(decorator, ast.Name):
+        return decorator.id
+    elif isinstance(decorator, ast.Attribute):
+        return f"{_expr_to_string(decorator.value)}.{decorator.attr}"
+    elif isinstance(decorator, ast.Call):
+        func_name = _expr_to_string(decorator.func)
+        return f"{func_name}(...)"
+    else:
+        return "unknown"
+
+
+def _expr_to_string(expr: ast.expr) -> str:
+    """Convert expression AST to string."""
+    # Walk down the attribute chain instead of recursing per attribute
+    parts = []
+    while isinstance(expr, ast.Attribute):
+        parts.append(expr.attr)
+        expr = expr.value
+    parts.append(expr.id if isinstance(expr, ast.Name) else "unknown")
+    return ".".join(reversed(parts))
+
+
+def _call_func_name(call: ast.Call) -> Optional[str]:
+    """Get the bare name of a called function or method."""
+    func = call.func
+    if type(func) is ast.Attribute:
+        return func.attr
+    elif type(func) is ast.Name:
+        return func.id
+    return None
+
+
+def _has_docstring(node: ast.FunctionDef) -> bool:
+    """Check whether a function body starts with a string literal."""
+    if not node.body:
         return False
-    
-    def _decorator_to_string(self, decorator: ast.expr) -> str:
-        """Convert decorator AST to string representation."""
-        if isinstance(decorator, ast.Name):
-            return decorator.id
-        elif isinstance(decorator, ast.Attribute):
-            return f"{self._expr_to_string(decorator.value)}.{decorator.attr}"
-        elif isinstance(decorator, ast.Call):
-            func_name = self._expr_to_string(decorator.func)
-            return f"{func_name}(...)"
-        else:
-            return "unknown"
-    
-    def _expr_to_string(self, expr: ast.expr) -> str:
-        """Convert expression AST to string."""
-        if isinstance(expr, ast.Name):
-            return expr.id
-        elif isinstance(expr, ast.Attribute):
-            return f"{self._expr_to_string(expr.value)}.{expr.attr}"
-        else:
-            return "unknown"
+    first = node.body[0]
+    return (
+        type(first) is ast.Expr
+        and type(first.value) is ast.Constant
+        and type(first.value.value) is str
+    )
 
 
 def analyze_api_patterns(project_path: Path) -> Dict[Path, List[str]]:
@@ -271,12 +359,18 @@ def analyze_api_patterns(project_path: Path) -> Dict[Path, List[str]]:
     # Analyze each route file
     for file_path in route_files:
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Very large files are usually generated rather than hand-written views
+            if file_path.stat().st_size > _MAX_ROUTE_FILE_SIZE:
+                report[file_path] = [f"ℹ️  Skipped {file_path.name}: larger than 1 MB"]
+                continue
+            
+            # Routes need a decorator and blueprints a Blueprint(...) call; files
+            # with neither cannot contribute anything, so don't parse them
+            source = source_bytes(file_path)
+            if b"@" not in source and b"Blueprint" not in source:
+                continue
             
-            tree = ast.parse(content)
-            visitor = APIVisitor(file_path)
-            visitor.visit(tree)
+            visitor = file_observers(file_path)["api"]
             
             # Generate issues for this file
             issues = _analyze_file_routes(visitor, file_path, project_path)
@@ -299,30 +393,19 @@ def _find_route_files(project_path: Path) -> List[Path]:
     """Find Python files that might contain Flask routes."""
     route_files: List[Path] = []
     
-    # Common patterns for route files
-    patterns = [
-        "**/*views.py",
-        "**/routes*.py", 
-        "**/api*.py",
-        "**/blueprint*.py",
-        "**/endpoints*.py",
-        "app.py",
-        "main.py",
-        "application.py"
-    ]
-    
-    for pattern in patterns:
-        route_files.extend(project_path.glob(pattern))
-    
-    # Also look in common directories
-    common_dirs = ["views", "routes", "api", "blueprints", "endpoints"]
-    for dir_name in common_dirs:
-        route_dir = project_path / dir_name
-        if route_dir.exists() and route_dir.is_dir():
-            route_files.extend(route_dir.glob("*.py"))
-    
-    # Remove duplicates and __init__.py files
-    route_files = [f for f in set(route_files) if f.name != "__init__.py"]
+    # A single walk yields each file once, so no deduplication is needed
+    for file_path in iter_py_files(project_path):
+        name = file_path.name
+        if name == "__init__.py":
+            continue
+        
+        parent = file_path.parent
+        if (
+            _ROUTE_FILE_RE.match(name)
+            or (parent == project_path and name in _ROOT_ROUTE_FILES)
+            or (parent.parent == project_path and parent.name in _ROUTE_DIRS)
+        ):
+            route_files.append(file_path)
     
     return route_files
 
@@ -332,8 +415,7 @@ def _analyze_file_routes(visitor: APIVisitor, file_path: Path, project_path: Pat
     issues = []
     
     # Check if this file has Flask imports
-    flask_imports = [imp for imp in visitor.imports if "flask" in imp.lower()]
-    if not flask_imports and visitor.routes:
+    if not visitor.has_flask_import and visitor.routes:
         issues.append("⚠️  Routes found but no Flask imports detected")
     
     # Analyze each route
@@ -351,8 +433,7 @@ def _analyze_file_routes(visitor: APIVisitor, file_path: Path, project_path: Pat
             issues.append(f"🛡️  Route '{route.function_name}' should include error handling")
         
         # Check for input validation on data-modifying routes
-        data_methods = ["POST", "PUT", "PATCH"]
-        if any(method in route.methods for method in data_methods) and not route.has_input_validation:
+        if not _DATA_METHODS.isdisjoint(route.method_set) and not route.has_input_validation:
             issues.append(f"🔍 Route '{route.function_name}' should validate input data")
         
         # Check for authentication on sensitive routes
@@ -377,34 +458,26 @@ def _analyze_file_routes(visitor: APIVisitor, file_path: Path, project_path: Pat
 def _follows_rest_conventions(route: RouteInfo) -> bool:
     """Check if a route follows REST conventions."""
     path = route.path.lower()
-    methods = route.methods
-    
-    # Basic REST patterns
-    rest_patterns = [
-        (r"/api/\w+/?$", ["GET", "POST"]),  # Collection
-        (r"/api/\w+/\d+/?$", ["GET", "PUT", "DELETE"]),  # Resource
-        (r"/api/\w+/<\w+>/?$", ["GET", "PUT", "DELETE"]),  # Resource with variable
-    ]
     
-    for pattern, expected_methods in rest_patterns:
-        if re.match(pattern, path):
-            return any(method in expected_methods for method in methods)
+    for pattern, expected_methods in _REST_PATTERNS:
+        if pattern.match(path):
+            return not expected_methods.isdisjoint(route.methods)
     
     return True  # Default to true for non-API routes
 
 
 def _is_sensitive_route(route: RouteInfo) -> bool:
     """Check if a route handles sensitive operations."""
-    sensitive_patterns = [
-        "delete", "remove", "admin", "user", "auth", "login", "password",
-        "create", "update", "edit", "modify"
-    ]
-    
-    path_lower = route.path.lower()
-    function_lower = route.function_name.lower()
-    
-    return any(pattern in path_lower or pattern in function_lower 
-              for pattern in sensitive_patterns)
+    return _is_sensitive(route.path.lower(), route.function_name.lower())
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive(path_lower: str, function_lower: str) -> bool:
+    """Check lowercased route path and function name for sensitive keywords."""
+    return (
+        _SENSITIVE_RE.search(path_lower) is not None
+        or _SENSITIVE_RE.search(function_lower) is not None
+    )
 
 
 def _analyze_api_architecture(routes: List[RouteInfo], blueprints: List[BlueprintInfo], 
@@ -414,46 +487,58 @@ def _analyze_api_architecture(routes: List[RouteInfo], blueprints: List[Blueprin
         return
     
     architecture_issues = []
+    total_routes = len(routes)
+    
+    # Gather all per-route counts in a single pass
+    versioned_count = 0
+    error_handled_count = 0
+    blueprint_count = 0
+    auth_count = 0
+    sensitive_count = 0
+    method_usage: Dict[str, int] = {}
+    for route in routes:
+        if _VERSION_RE.search(route.path):
+            versioned_count += 1
+        if route.has_error_handling:
+            error_handled_count += 1
+        if route.blueprint:
+            blueprint_count += 1
+        if route.has_authentication:
+            auth_count += 1
+        if _is_sensitive_route(route):
+            sensitive_count += 1
+        for method in route.methods:
+            method_usage[method] = method_usage.get(method, 0) + 1
     
     # Check for API versioning
-    versioned_routes = [r for r in routes if re.search(r'/v\d+/', r.path)]
-    if not versioned_routes and len(routes) > 5:
+    if not versioned_count and total_routes > 5:
         architecture_issues.append("📈 Consider API versioning (e.g., /api/v1/)")
     
     # Check for consistent error handling patterns
-    error_handled_routes = [r for r in routes if r.has_error_handling]
-    if len(error_handled_routes) < len(routes) * 0.5:
+    if error_handled_count < total_routes * 0.5:
         architecture_issues.append("🛡️  Less than 50% of routes have error handling")
     
     # Check for blueprint organization
-    blueprint_routes = [r for r in routes if r.blueprint]
-    if len(blueprint_routes) < len(routes) * 0.7 and len(routes) > 10:
+    if blueprint_count < total_routes * 0.7 and total_routes > 10:
         architecture_issues.append("🏗️  Consider organizing routes into blueprints")
     
     # Check for authentication patterns
-    auth_routes = [r for r in routes if r.has_authentication]
-    sensitive_routes = [r for r in routes if _is_sensitive_route(r)]
-    if len(sensitive_routes) > 0 and len(auth_routes) < len(sensitive_routes) * 0.8:
+    if sensitive_count > 0 and auth_count < sensitive_count * 0.8:
         architecture_issues.append("🔐 Many sensitive routes lack authentication")
     
     # Check HTTP method distribution
-    method_usage = {}
-    for route in routes:
-        for method in route.methods:
-            method_usage[method] = method_usage.get(method, 0) + 1
-    
-    if method_usage.get("GET", 0) > len(routes) * 0.8:
+    if method_usage.get("GET", 0) > total_routes * 0.8:
         architecture_issues.append("💡 Consider using more HTTP methods (POST, PUT, DELETE)")
     
     # Success messages
     if blueprints:
         architecture_issues.append(f"✅ Good: Project uses {len(blueprints)} blueprint(s)")
     
-    if versioned_routes:
+    if versioned_count:
         architecture_issues.append("✅ Good: API versioning detected")
     
-    if len(auth_routes) > 0:
-        architecture_issues.append(f"✅ Good: {len(auth_routes)} route(s) have authentication")
+    if auth_count > 0:
+        architecture_issues.append(f"✅ Good: {auth_count} route(s) have authentication")
     
     if architecture_issues:
         report[project_path / "API_ARCHITECTURE"] = architecture_issues
@@ -1,24 +1,43 @@
 import typer
-import logging
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-
-from freview.project_analyzer import analyze_project_structure
-from freview.model_checker import analyze_models
-from freview.api_analyzer import analyze_api_patterns
-from freview.database_analyzer import analyze_database_patterns
-from freview.utils import write_markdown_report, write_json_report
-from freview import __version__
+from rich.style import Style
+from rich.text import Text
 
 console = Console()
 
+# Styles built once and applied directly, so result lines skip markup parsing
+_STYLES = {
+    name: Style.parse(name)
+    for name in ("red", "yellow", "green", "blue", "magenta", "cyan", "dim", "bold", "bold cyan")
+}
+
+# Rich styles for issue lines, keyed by the emoji an issue starts with
+_ISSUE_STYLES = {"❌": _STYLES["red"], "⚠️": _STYLES["yellow"], "✅": _STYLES["green"]}
+_MODEL_ISSUE_STYLES = {**_ISSUE_STYLES, "ℹ️": _STYLES["blue"]}
+_API_ISSUE_STYLES = {
+    **_ISSUE_STYLES,
+    "🔐": _STYLES["magenta"],
+    "🛡️": _STYLES["magenta"],
+    "💡": _STYLES["blue"],
+    "📈": _STYLES["cyan"],
+    "🏗️": _STYLES["cyan"],
+}
+_DATABASE_ISSUE_STYLES = {
+    **_ISSUE_STYLES,
+    "🔐": _STYLES["magenta"],
+    "💡": _STYLES["blue"],
+    "ℹ️": _STYLES["cyan"],
+}
+
 
 def version_callback(value: bool):
     if value:
+        from freview import __version__
+
         console.print(f"freview version {__version__}")
         raise typer.Exit()
 
@@ -44,12 +63,22 @@ def review(
     skip_db: bool = typer.Option(False, "--skip-db", help="Skip database analysis"),
     skip_models: bool = typer.Option(False, "--skip-models", help="Skip model analysis"),
     skip_structure: bool = typer.Option(False, "--skip-structure", help="Skip structure analysis"),
+    cache: bool = typer.Option(
+        False, "--cache", help="Reuse model results for unchanged files from .freview_cache/"
+    ),
 ):
     """Review Flask project structure, SQLAlchemy models, API patterns, and database configurations with comprehensive analysis."""
 
-    # Setup logging
+    # Setup logging, configuring handlers only the first time. Imported here
+    # since no other command logs.
+    import logging
+
     log_level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+    elif root_logger.level != log_level:
+        root_logger.setLevel(log_level)
 
     project_path = Path(path).resolve()
     if not project_path.exists():
@@ -65,16 +94,32 @@ def review(
     if output_dir and not output_path.exists():
         output_path.mkdir(parents=True, exist_ok=True)
 
+    # Rendering helpers only this command needs
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    # Analyzers are imported only once there is a valid project to review. They
+    # are imported together, before any analysis runs, so every analyzer's
+    # observer is registered for the shared one-walk-per-file pass.
+    from freview.project_analyzer import analyze_project_structure
+    from freview.model_checker import analyze_models
+    from freview.api_analyzer import analyze_api_patterns
+    from freview.database_analyzer import analyze_database_patterns
+    from freview._ast_cache import clear_caches
+
     console.print(Panel.fit("🔍 Reviewing Flask Project", style="bold blue"))
     console.print(f"[dim]📁 Project Path:[/dim] {project_path}\n")
 
     try:
-        # Analyze project with progress indicator
+        # Analyze project with progress indicator. Without a terminal to draw
+        # on the spinner is invisible, so it is disabled and no render thread runs.
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
             transient=True,
+            refresh_per_second=4,
+            disable=not console.is_terminal,
         ) as progress:
 
             # Structure analysis
@@ -87,7 +132,8 @@ def review(
             model_issues = {}
             if not skip_models:
                 progress.add_task("Analyzing SQLAlchemy models...", total=None)
-                model_issues = analyze_models(project_path)
+                cache_dir = project_path / ".freview_cache" if cache else None
+                model_issues = analyze_models(project_path, cache_dir)
 
             # API analysis
             api_issues = {}
@@ -111,13 +157,22 @@ def review(
         if not skip_db:
             _display_database_results(db_issues, project_path)
 
-        # Generate reports
+        # Generate reports, with one timestamp shared by every format
+        generated_at = datetime.now()
         if markdown:
-            report_path = write_markdown_report(output_path, structure_issues, model_issues, api_issues, db_issues)
+            from freview.utils import write_markdown_report
+
+            report_path = write_markdown_report(
+                output_path, structure_issues, model_issues, api_issues, db_issues, generated_at
+            )
             console.print(f"\n[green]📝 Markdown report saved:[/green] {report_path}")
 
         if json_output:
-            report_path = write_json_report(output_path, structure_issues, model_issues, api_issues, db_issues)
+            from freview.utils import write_json_report
+
+            report_path = write_json_report(
+                output_path, structure_issues, model_issues, api_issues, db_issues, generated_at
+            )
             console.print(f"\n[green]📝 JSON report saved:[/green] {report_path}")
 
     except Exception as e:
@@ -125,6 +180,9 @@ def review(
         if verbose:
             console.print_exception()
         raise typer.Exit(1)
+    finally:
+        # Cached file contents, trees and walks are only shared within one review
+        clear_caches()
 
 
 def _display_structure_results(issues: List[str]):
@@ -135,6 +193,8 @@ def _display_structure_results(issues: List[str]):
         console.print("✅ [green]Project structure looks good![/green]")
         return
 
+    from rich.table import Table
+
     table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column("Icon", style="yellow", no_wrap=True)
     table.add_column("Issue", style="dim")
@@ -150,114 +210,88 @@ def _display_structure_results(issues: List[str]):
 
 def _display_model_results(model_issues: dict, project_path: Path):
     """Display model analysis results with rich formatting."""
-    console.print("\n[bold]🧠 SQLAlchemy Model Analysis[/bold]")
-
-    if not model_issues:
-        console.print("[yellow]⚠️ No model files found in the project[/yellow]")
-        return
-
-    for file_path, issues in model_issues.items():
-        relative_path = file_path.relative_to(project_path)
-
-        console.print(f"\n[bold cyan]📄 {relative_path}[/bold cyan]")
-
-        if not issues:
-            console.print("  [dim]No issues found[/dim]")
-            continue
-
-        for issue in issues:
-            if issue.startswith("❌"):
-                console.print(f"  [red]{issue}[/red]")
-            elif issue.startswith("⚠️"):
-                console.print(f"  [yellow]{issue}[/yellow]")
-            elif issue.startswith("✅"):
-                console.print(f"  [green]{issue}[/green]")
-            elif issue.startswith("ℹ️"):
-                console.print(f"  [blue]{issue}[/blue]")
-            else:
-                console.print(f"  [dim]{issue}[/dim]")
+    _display_file_keyed_results(
+        "🧠 SQLAlchemy Model Analysis",
+        "No model files found in the project",
+        model_issues,
+        project_path,
+        _MODEL_ISSUE_STYLES,
+    )
 
 
 def _display_api_results(api_issues: dict, project_path: Path):
     """Display API analysis results with rich formatting."""
-    console.print("\n[bold]🌐 API Pattern Analysis[/bold]")
-
-    if not api_issues:
-        console.print("[yellow]⚠️ No API patterns detected in the project[/yellow]")
-        return
-
-    for file_path, issues in api_issues.items():
-        if isinstance(file_path, Path):
-            try:
-                relative_path = file_path.relative_to(project_path)
-                console.print(f"\n[bold cyan]📄 {relative_path}[/bold cyan]")
-            except ValueError:
-                # Handle special analysis keys like "API_ARCHITECTURE"
-                console.print(f"\n[bold cyan]📊 {file_path.name}[/bold cyan]")
-        else:
-            # Handle string keys
-            console.print(f"\n[bold cyan]📊 {str(file_path)}[/bold cyan]")
-
-        if not issues:
-            console.print("  [dim]No issues found[/dim]")
-            continue
-
-        for issue in issues:
-            if issue.startswith("❌"):
-                console.print(f"  [red]{issue}[/red]")
-            elif issue.startswith("⚠️"):
-                console.print(f"  [yellow]{issue}[/yellow]")
-            elif issue.startswith("✅"):
-                console.print(f"  [green]{issue}[/green]")
-            elif issue.startswith("🔐") or issue.startswith("🛡️"):
-                console.print(f"  [magenta]{issue}[/magenta]")
-            elif issue.startswith("💡"):
-                console.print(f"  [blue]{issue}[/blue]")
-            elif issue.startswith("📈") or issue.startswith("🏗️"):
-                console.print(f"  [cyan]{issue}[/cyan]")
-            else:
-                console.print(f"  [dim]{issue}[/dim]")
+    _display_file_keyed_results(
+        "🌐 API Pattern Analysis",
+        "No API patterns detected in the project",
+        api_issues,
+        project_path,
+        _API_ISSUE_STYLES,
+    )
 
 
 def _display_database_results(db_issues: dict, project_path: Path):
     """Display database analysis results with rich formatting."""
-    console.print("\n[bold]🗄️ Database Analysis[/bold]")
+    _display_file_keyed_results(
+        "🗄️ Database Analysis",
+        "No database patterns detected in the project",
+        db_issues,
+        project_path,
+        _DATABASE_ISSUE_STYLES,
+    )
 
-    if not db_issues:
-        console.print("[yellow]⚠️ No database patterns detected in the project[/yellow]")
+
+def _display_file_keyed_results(
+    title: str, empty_message: str, issues_by_file: dict, project_path: Path, styles: dict
+):
+    """Display per-file analysis results, styling each issue by its leading emoji."""
+    text = Text("\n")
+    text.append(title, _STYLES["bold"])
+
+    if not issues_by_file:
+        text.append("\n")
+        text.append(f"⚠️ {empty_message}", _STYLES["yellow"])
+        _print_section(text)
         return
 
-    for file_path, issues in db_issues.items():
-        if isinstance(file_path, Path):
-            try:
-                relative_path = file_path.relative_to(project_path)
-                console.print(f"\n[bold cyan]📄 {relative_path}[/bold cyan]")
-            except ValueError:
-                # Handle special analysis keys
-                console.print(f"\n[bold cyan]📊 {file_path.name}[/bold cyan]")
-        else:
-            # Handle string keys
-            console.print(f"\n[bold cyan]📊 {str(file_path)}[/bold cyan]")
+    dim = _STYLES["dim"]
+    heading = _STYLES["bold cyan"]
+    for file_path, issues in issues_by_file.items():
+        text.append("\n\n")
+        text.append(_file_heading(file_path, project_path), heading)
 
         if not issues:
-            console.print("  [dim]No issues found[/dim]")
-            continue
+            text.append("\n  ")
+            text.append("No issues found", dim)
 
         for issue in issues:
-            if issue.startswith("❌"):
-                console.print(f"  [red]{issue}[/red]")
-            elif issue.startswith("⚠️"):
-                console.print(f"  [yellow]{issue}[/yellow]")
-            elif issue.startswith("✅"):
-                console.print(f"  [green]{issue}[/green]")
-            elif issue.startswith("🔐"):
-                console.print(f"  [magenta]{issue}[/magenta]")
-            elif issue.startswith("💡"):
-                console.print(f"  [blue]{issue}[/blue]")
-            elif issue.startswith("ℹ️"):
-                console.print(f"  [cyan]{issue}[/cyan]")
-            else:
-                console.print(f"  [dim]{issue}[/dim]")
+            # Emoji with a variation selector span two characters
+            style = styles.get(issue[:2]) or styles.get(issue[:1], dim)
+            text.append("\n  ")
+            text.append(issue, style)
+
+    _print_section(text)
+
+
+def _print_section(text: Text) -> None:
+    """Print a section in one write, highlighted as console.print would a string."""
+    # Line styles go on top of the highlighting, as markup styles did
+    highlighted = console.highlighter(Text(text.plain))
+    highlighted.spans.extend(text.spans)
+    console.print(highlighted)
+
+
+@lru_cache(maxsize=4096)
+def _file_heading(file_path, project_path: Path) -> str:
+    """Build the heading label for a report key, computed once per file across sections."""
+    if isinstance(file_path, Path):
+        try:
+            return f"📄 {file_path.relative_to(project_path)}"
+        except ValueError:
+            # Handle special analysis keys like "API_ARCHITECTURE"
+            return f"📊 {file_path.name}"
+    # Handle string keys
+    return f"📊 {str(file_path)}"
 
 
 @app.command()
@@ -2,14 +2,18 @@
 Configuration management for freview.
 """
 
+import copy
+import os
 import tomllib
+from fnmatch import translate
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Pattern
-from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Sequence, Set, Tuple
+from dataclasses import dataclass, field, fields
 import re
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewConfig:
     """Configuration for freview analysis."""
 
@@ -40,46 +44,72 @@ class ReviewConfig:
     check_str_methods: bool = True
     require_docstrings: bool = False
 
+    # Compiled naming patterns, filled in by __post_init__
+    _class_name_regex: Pattern[str] = field(init=False, repr=False, compare=False)
+    _table_name_regex: Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Compile the naming patterns once rather than on every access
+        self._class_name_regex = re.compile(self.class_name_pattern)
+        self._table_name_regex = re.compile(self.table_name_pattern)
+
     @property
     def class_name_regex(self) -> Pattern[str]:
         """Compiled regex for class name validation."""
-        return re.compile(self.class_name_pattern)
+        if self._class_name_regex.pattern != self.class_name_pattern:
+            self._class_name_regex = re.compile(self.class_name_pattern)
+        return self._class_name_regex
 
     @property
     def table_name_regex(self) -> Pattern[str]:
         """Compiled regex for table name validation."""
-        return re.compile(self.table_name_pattern)
+        if self._table_name_regex.pattern != self.table_name_pattern:
+            self._table_name_regex = re.compile(self.table_name_pattern)
+        return self._table_name_regex
 
 
 def load_config(project_path: Path) -> ReviewConfig:
     """
     Load configuration from project directory.
 
-    Looks for .freview.toml in the project root.
+    Looks for .freview.toml in the project root. The file is parsed once per
+    modification time, so repeated calls during a review are cheap.
     """
-    config = ReviewConfig()
     config_file = project_path / ".freview.toml"
 
-    if not config_file.exists():
-        return config
-
     try:
-        with open(config_file, "rb") as f:
-            data = tomllib.load(f)
+        stat = config_file.stat()
+    except OSError:
+        return ReviewConfig()
 
-        # Extract freview section
-        freview_config = data.get("freview", {})
+    # An empty file holds no settings, so skip reading and parsing it
+    if stat.st_size == 0:
+        return ReviewConfig()
+
+    values = _config_values(config_file, stat.st_mtime_ns, stat.st_size)
+    try:
+        # Each caller gets its own copy of list settings
+        return ReviewConfig(**copy.deepcopy(values))
+    except Exception as e:
+        print(f"Warning: Could not load config file: {e}")
+        return ReviewConfig()
 
-        # Update config with file values
-        for key, value in freview_config.items():
-            if hasattr(config, key):
-                setattr(config, key, value)
 
+@lru_cache(maxsize=16)
+def _config_values(config_file: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Read the known settings from a config file's [freview] section."""
+    try:
+        # Read the whole file in one call rather than through a file object
+        data = tomllib.loads(config_file.read_text(encoding="utf-8"))
     except Exception as e:
         # If config file is malformed, use defaults
         print(f"Warning: Could not load config file: {e}")
+        return {}
 
-    return config
+    # Extract freview section, keeping only recognised settings
+    freview_config = data.get("freview", {})
+    known = {f.name for f in fields(ReviewConfig) if f.init}
+    return {key: value for key, value in freview_config.items() if key in known}
 
 
 def create_default_config(project_path: Path) -> Path:
@@ -126,10 +156,72 @@ require_docstrings = false
 def get_effective_model_dirs(config: ReviewConfig, project_path: Path) -> List[Path]:
     """Get the actual model directories that exist in the project."""
     model_dirs = []
+    # Directory names found in each scanned parent, so sibling patterns such as
+    # "models" and "app/models" share one scandir per parent instead of stats
+    subdir_names: Dict[Path, Set[str]] = {}
 
     for dir_pattern in config.model_dirs:
         model_path = project_path / dir_pattern
-        if model_path.exists() and model_path.is_dir():
+        name = model_path.name
+        if name in ("", ".", ".."):
+            if model_path.is_dir():
+                model_dirs.append(model_path)
+            continue
+
+        parent = model_path.parent
+        names = subdir_names.get(parent)
+        if names is None:
+            names = subdir_names[parent] = _subdir_names(parent)
+        if name in names:
             model_dirs.append(model_path)
 
     return model_dirs
+
+
+def _subdir_names(directory: Path) -> Set[str]:
+    """Names of the directories (including symlinks to them) directly inside a directory."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
+
+
+def iter_py_files(root: Path, exclude: Sequence[str] = ()) -> Iterator[Path]:
+    """
+    Yield the Python files under a directory, recursively.
+
+    Walks with os.scandir so file and directory checks reuse the cached
+    directory entries instead of issuing a stat() per path. Files and
+    directories whose names match any of the exclude glob patterns are
+    skipped. Symlinked directories are not followed.
+    """
+    return _walk_py_files(root, _compile_globs(tuple(exclude)))
+
+
+def _walk_py_files(root: Path, excluded: Optional[Pattern[str]]) -> Iterator[Path]:
+    """Recursive worker for iter_py_files."""
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                name = entry.name
+                if excluded is not None and excluded.match(name):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif name.endswith(".py") and entry.is_file():
+                    yield Path(entry.path)
+    except OSError:
+        return
+
+    for subdir in subdirs:
+        yield from _walk_py_files(Path(subdir), excluded)
+
+
+@lru_cache(maxsize=32)
+def _compile_globs(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Translate glob patterns into one case-sensitive regex, or None if there are none."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{translate(pattern)})" for pattern in patterns))
@@ -11,8 +11,109 @@ from pathlib import Path
 from typing import Dict, List, Set, Optional
 from dataclasses import dataclass, field
 
+from ._ast_cache import CompositeVisitor, file_observers, register_observer, source_bytes
+from .config import iter_py_files
 
-@dataclass
+
+# Directories that never hold project code; the file walks do not descend into them
+_PRUNED_DIRS = ("__pycache__", ".venv", "venv", "node_modules", ".git", "build", "dist")
+
+# Where migrations and database configuration are looked for, in order
+_MIGRATION_DIR_CANDIDATES = (("migrations",), ("alembic",), ("db", "migrations"))
+_CONFIG_FILE_CANDIDATES = (
+    ("config.py",),
+    ("app", "config.py"),
+    ("settings.py",),
+    (".env",),
+    ("app.py",),
+)
+
+# Everything a migration file is checked for, found in one scan of its raw
+# bytes. Each named group marks one check; the dangerous operations match
+# case-insensitively. alter_column only marks the call here; whether it makes
+# a column NOT NULL is confirmed afterwards with _ALTER_NOT_NULL.
+_MIGRATION_SCAN = re.compile(
+    rb"(?P<upgrade>def upgrade\(\):)"
+    rb"|(?P<downgrade>def downgrade\(\):)"
+    rb"|(?P<drop_table>(?i:drop_table))"
+    rb"|(?P<drop_column>(?i:drop_column))"
+    rb"|(?P<alter_column>(?i:alter_column))"
+    rb"|(?P<create_index>create_index)"
+    rb"|(?P<foreign_key>(?i:foreign_key)|foreignkey)"
+)
+
+# An alter_column call followed by nullable=False on the same line. Each line
+# is tried once from its first alter_column: the lookahead cannot be
+# backtracked into, so a line with many calls is not rescanned for each one.
+_ALTER_NOT_NULL = re.compile(
+    rb"(?im)^(?=(?P<prefix>[^\n]*?alter_column))(?P=prefix)[^\n]*nullable=False"
+)
+
+# Dangerous operation groups in _MIGRATION_SCAN and the pattern reported for each
+_DANGEROUS_MIGRATION_OPERATIONS = (
+    ("drop_table", "drop_table"),
+    ("drop_column", "drop_column"),
+    ("alter_column", "alter_column.*nullable=False"),
+)
+
+# Everything a configuration file is checked for, found in one scan. The whole
+# alternation is a lookahead so neighbouring settings can never hide each other.
+_CONFIG_SCAN = re.compile(
+    r"(?=(?P<uri>(?i:DATABASE_URI))"
+    r"|(?P<credentials>password=|passwd=|://user:)"
+    r"|(?P<pool>SQLALCHEMY_POOL_SIZE|SQLALCHEMY_POOL_TIMEOUT|SQLALCHEMY_MAX_OVERFLOW)"
+    r"|(?P<sqlalchemy>SQLALCHEMY_TRACK_MODIFICATIONS|SQLALCHEMY_ECHO|SQLALCHEMY_RECORD_QUERIES)"
+    r"|(?P<env>os\.environ|getenv))"
+)
+_POOL_SETTINGS = ("SQLALCHEMY_POOL_SIZE", "SQLALCHEMY_POOL_TIMEOUT", "SQLALCHEMY_MAX_OVERFLOW")
+_SQLALCHEMY_SETTINGS = (
+    "SQLALCHEMY_TRACK_MODIFICATIONS",
+    "SQLALCHEMY_ECHO",
+    "SQLALCHEMY_RECORD_QUERIES",
+)
+
+# Substrings of a lowercased call name that mark query and transaction calls,
+# each set matched with a single regex search
+_QUERY_CALL_RE = re.compile(
+    "query|select|filter|join|execute|fetchall|fetchone|first|all|get|get_or_404"
+)
+_TRANSACTION_CALL_RE = re.compile("commit|rollback|begin|transaction|session")
+
+# Terms in an uppercased variable name that mark a database setting. Matching
+# the uppercased name is faster than a case-insensitive regex on short names.
+_DB_CONFIG_NAME_RE = re.compile("DATABASE|DB|SQL|URI|POOL")
+
+# Any mention of a join in a file, searched without lowercasing the whole file
+_JOIN_RE = re.compile("join", re.IGNORECASE)
+
+# Substrings that mark a file as using the database, matched against raw bytes
+_DB_USAGE_MARKERS = (
+    b"from flask_sqlalchemy",
+    b"import sqlalchemy",
+    b"db.session",
+    b"query(",
+    b".filter(",
+    b".commit()",
+    b".rollback()",
+)
+
+# Substrings the per-file usage checks look for, each searched once per file
+_DB_FILE_MARKERS = (
+    "db.session.add",
+    "db.session.delete",
+    "db.session.commit",
+    "execute(",
+    '"SELECT',
+    "'SELECT",
+    '"INSERT',
+    "'INSERT",
+    "try:",
+    "query",
+)
+_RAW_SQL_MARKERS = frozenset({'"SELECT', "'SELECT", '"INSERT', "'INSERT"})
+
+
+@dataclass(slots=True)
 class MigrationInfo:
     """Information about a database migration."""
     
@@ -24,7 +125,7 @@ class MigrationInfo:
     dependencies: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexInfo:
     """Information about database indexes."""
     
@@ -35,7 +136,7 @@ class IndexInfo:
     file_path: Optional[Path] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseConfig:
     """Information about database configuration."""
     
@@ -46,8 +147,24 @@ class DatabaseConfig:
     engine_options: Dict[str, str] = field(default_factory=dict)
 
 
-class DatabaseVisitor(ast.NodeVisitor):
-    """AST visitor for analyzing database patterns."""
+@dataclass(slots=True)
+class _ScanContext:
+    """Files found by the one project walk, classified for each database check."""
+    
+    python_files: List[Path]
+    migrations_dir: Optional[Path] = None
+    migration_files: List[Path] = field(default_factory=list)
+    config_files: List[Path] = field(default_factory=list)
+    model_files: List[Path] = field(default_factory=list)
+
+
+class DatabaseVisitor:
+    """
+    AST observer for analyzing database patterns.
+
+    Hooks follow the observer protocol in ``freview._ast_cache`` so the visitor
+    can share a walk with the other analyzers; ``visit`` runs it on its own.
+    """
     
     def __init__(self, file_path: Path):
         self.file_path = file_path
@@ -57,79 +174,80 @@ class DatabaseVisitor(ast.NodeVisitor):
         self.config_items: Dict[str, str] = {}
         self.imports: Set[str] = set()
         self.transactions: List[str] = []
+        # Depth of enclosing function definitions; settings are only module or class level
+        self._function_depth = 0
+    
+    def visit(self, tree: ast.AST):
+        """Walk a tree with only this visitor attached."""
+        CompositeVisitor([self]).visit(tree)
     
     def visit_Import(self, node):
         """Track imports for database libraries."""
         for alias in node.names:
             self.imports.add(alias.name)
-        self.generic_visit(node)
     
     def visit_ImportFrom(self, node):
         """Track from imports."""
         if node.module:
             for alias in node.names:
                 self.imports.add(f"{node.module}.{alias.name}")
-        self.generic_visit(node)
+    
+    def visit_FunctionDef(self, node):
+        """Note entering a function body."""
+        self._function_depth += 1
+    
+    def leave_FunctionDef(self, node):
+        """Note leaving a function body."""
+        self._function_depth -= 1
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    leave_AsyncFunctionDef = leave_FunctionDef
     
     def visit_Call(self, node):
         """Analyze function calls for database patterns."""
         call_name = self._get_call_name(node)
+        lowered = call_name.lower()
         
         # Track database queries
-        if self._is_query_call(call_name):
+        if self._is_query_call(lowered):
             self.query_patterns.append(call_name)
         
         # Track transaction patterns
-        if self._is_transaction_call(call_name):
+        if self._is_transaction_call(lowered):
             self.transactions.append(call_name)
         
         # Track index creation
-        if self._is_index_call(call_name):
+        if self._is_index_call(lowered):
             index_info = self._extract_index_info(node)
             if index_info:
                 self.indexes.append(index_info)
-        
-        self.generic_visit(node)
     
     def visit_Assign(self, node):
-        """Look for configuration assignments."""
+        """Look for configuration assignments at module or class level."""
+        if self._function_depth:
+            return
         if isinstance(node.value, ast.Constant):
             for target in node.targets:
                 if isinstance(target, ast.Name):
                     var_name = target.id.upper()
-                    if any(db_term in var_name for db_term in 
-                          ["DATABASE", "DB", "SQL", "URI", "POOL"]):
+                    if _DB_CONFIG_NAME_RE.search(var_name):
                         self.config_items[var_name] = str(node.value.value)
-        
-        self.generic_visit(node)
     
     def _get_call_name(self, call: ast.Call) -> str:
         """Get the name of a function call."""
-        if isinstance(call.func, ast.Name):
-            return call.func.id
-        elif isinstance(call.func, ast.Attribute):
-            return f"{self._expr_to_string(call.func.value)}.{call.func.attr}"
-        else:
-            return "unknown"
+        return self._expr_to_string(call.func)
     
-    def _is_query_call(self, call_name: str) -> bool:
-        """Check if a call represents a database query."""
-        query_patterns = [
-            "query", "select", "filter", "join", "execute", "fetchall", 
-            "fetchone", "first", "all", "get", "get_or_404"
-        ]
-        return any(pattern in call_name.lower() for pattern in query_patterns)
+    def _is_query_call(self, lowered_name: str) -> bool:
+        """Check if a lowercased call name represents a database query."""
+        return _QUERY_CALL_RE.search(lowered_name) is not None
     
-    def _is_transaction_call(self, call_name: str) -> bool:
-        """Check if a call represents a transaction operation."""
-        transaction_patterns = [
-            "commit", "rollback", "begin", "transaction", "session"
-        ]
-        return any(pattern in call_name.lower() for pattern in transaction_patterns)
+    def _is_transaction_call(self, lowered_name: str) -> bool:
+        """Check if a lowercased call name represents a transaction operation."""
+        return _TRANSACTION_CALL_RE.search(lowered_name) is not None
     
-    def _is_index_call(self, call_name: str) -> bool:
-        """Check if a call creates an index."""
-        return "index" in call_name.lower() and "create" in call_name.lower()
+    def _is_index_call(self, lowered_name: str) -> bool:
+        """Check if a lowercased call name creates an index."""
+        return "index" in lowered_name and "create" in lowered_name
     
     def _extract_index_info(self, call: ast.Call) -> Optional[IndexInfo]:
         """Extract index information from a call."""
@@ -139,12 +257,16 @@ class DatabaseVisitor(ast.NodeVisitor):
     
     def _expr_to_string(self, expr: ast.expr) -> str:
         """Convert expression AST to string."""
-        if isinstance(expr, ast.Name):
-            return expr.id
-        elif isinstance(expr, ast.Attribute):
-            return f"{self._expr_to_string(expr.value)}.{expr.attr}"
-        else:
-            return "unknown"
+        # Walk down the attribute chain instead of recursing per attribute
+        parts = []
+        while isinstance(expr, ast.Attribute):
+            parts.append(expr.attr)
+            expr = expr.value
+        parts.append(expr.id if isinstance(expr, ast.Name) else "unknown")
+        return ".".join(reversed(parts))
+
+
+register_observer("database", DatabaseVisitor)
 
 
 def analyze_database_patterns(project_path: Path) -> Dict[Path, List[str]]:
@@ -157,25 +279,28 @@ def analyze_database_patterns(project_path: Path) -> Dict[Path, List[str]]:
     Returns:
         Dictionary mapping file paths to lists of issues/recommendations
     """
+    # One walk finds the files for every check
+    scan = _scan_project(project_path)
+    
     report = {}
     
     # Analyze migrations
-    migrations_report = _analyze_migrations(project_path)
+    migrations_report = _analyze_migrations(project_path, scan)
     if migrations_report:
         report.update(migrations_report)
     
     # Analyze database configuration
-    config_report = _analyze_database_config(project_path)
+    config_report = _analyze_database_config(project_path, scan)
     if config_report:
         report.update(config_report)
     
     # Analyze database usage patterns
-    usage_report = _analyze_database_usage(project_path)
+    usage_report = _analyze_database_usage(project_path, scan)
     if usage_report:
         report.update(usage_report)
     
     # Analyze query patterns
-    query_report = _analyze_query_patterns(project_path)
+    query_report = _analyze_query_patterns(project_path, scan)
     if query_report:
         report.update(query_report)
     
@@ -188,23 +313,44 @@ def analyze_database_patterns(project_path: Path) -> Dict[Path, List[str]]:
     return report
 
 
-def _analyze_migrations(project_path: Path) -> Dict[Path, List[str]]:
+def _scan_project(project_path: Path) -> _ScanContext:
+    """Walk the project once and sort out the files each check reads."""
+    scan = _ScanContext(python_files=list(iter_py_files(project_path, _PRUNED_DIRS)))
+    
+    for parts in _MIGRATION_DIR_CANDIDATES:
+        dir_path = project_path.joinpath(*parts)
+        if dir_path.is_dir():
+            scan.migrations_dir = dir_path
+            break
+    versions_dir = scan.migrations_dir / "versions" if scan.migrations_dir else None
+    
+    # Files inside a models package come before models.py modules
+    module_files = []
+    for file_path in scan.python_files:
+        parent = file_path.parent
+        if parent == versions_dir and file_path.name != "__init__.py":
+            scan.migration_files.append(file_path)
+        if parent.name == "models":
+            scan.model_files.append(file_path)
+        if file_path.name == "models.py":
+            module_files.append(file_path)
+    scan.model_files.extend(module_files)
+    
+    # Python configuration files were found by the walk; only .env needs a stat
+    found = set(scan.python_files)
+    for parts in _CONFIG_FILE_CANDIDATES:
+        config_file = project_path.joinpath(*parts)
+        if config_file in found or (config_file.suffix != ".py" and config_file.exists()):
+            scan.config_files.append(config_file)
+    
+    return scan
+
+
+def _analyze_migrations(project_path: Path, scan: _ScanContext) -> Dict[Path, List[str]]:
     """Analyze Alembic migrations."""
     report = {}
     
-    # Look for migrations directory
-    migration_dirs = [
-        project_path / "migrations",
-        project_path / "alembic",
-        project_path / "db" / "migrations"
-    ]
-    
-    migrations_dir = None
-    for dir_path in migration_dirs:
-        if dir_path.exists() and dir_path.is_dir():
-            migrations_dir = dir_path
-            break
-    
+    migrations_dir = scan.migrations_dir
     if not migrations_dir:
         report[project_path / "MIGRATIONS"] = [
             "⚠️  No migrations directory found",
@@ -221,8 +367,7 @@ def _analyze_migrations(project_path: Path) -> Dict[Path, List[str]]:
         issues.append("⚠️  No migrations/versions directory found")
     else:
         # Analyze migration files
-        migration_files = list(versions_dir.glob("*.py"))
-        migration_files = [f for f in migration_files if f.name != "__init__.py"]
+        migration_files = scan.migration_files
         
         if not migration_files:
             issues.append("⚠️  No migration files found")
@@ -259,32 +404,38 @@ def _analyze_migration_file(migration_file: Path) -> List[str]:
     issues = []
     
     try:
-        with open(migration_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        # Scanned as bytes, so migrations are never decoded. The read goes
+        # through the source cache and is shared with the usage pass.
+        content = source_bytes(migration_file)
+        
+        # Collect which checks matched, stopping once all of them have
+        found = set()
+        for match in _MIGRATION_SCAN.finditer(content):
+            found.add(match.lastgroup)
+            if len(found) == len(_MIGRATION_SCAN.groupindex):
+                break
+        if "alter_column" in found and not _ALTER_NOT_NULL.search(content):
+            found.discard("alter_column")
         
         # Check for upgrade function
-        if "def upgrade():" not in content:
+        if "upgrade" not in found:
             issues.append(f"⚠️  Migration {migration_file.name} missing upgrade() function")
         
         # Check for downgrade function
-        if "def downgrade():" not in content:
+        if "downgrade" not in found:
             issues.append(f"⚠️  Migration {migration_file.name} missing downgrade() function")
         
         # Check for potentially dangerous operations
-        dangerous_patterns = [
-            "drop_table", "drop_column", "alter_column.*nullable=False"
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for group, pattern in _DANGEROUS_MIGRATION_OPERATIONS:
+            if group in found:
                 issues.append(f"⚠️  Migration {migration_file.name} contains potentially dangerous operation: {pattern}")
         
         # Check for index creation
-        if "create_index" in content:
+        if "create_index" in found:
             issues.append(f"✅ Migration {migration_file.name} includes index creation")
         
         # Check for foreign key constraints
-        if "foreign_key" in content.lower() or "foreignkey" in content:
+        if "foreign_key" in found:
             issues.append(f"✅ Migration {migration_file.name} includes foreign key constraints")
         
     except Exception as e:
@@ -293,27 +444,17 @@ def _analyze_migration_file(migration_file: Path) -> List[str]:
     return issues
 
 
-def _analyze_database_config(project_path: Path) -> Dict[Path, List[str]]:
+def _analyze_database_config(project_path: Path, scan: _ScanContext) -> Dict[Path, List[str]]:
     """Analyze database configuration."""
     report = {}
     
-    # Look for configuration files
-    config_files = [
-        project_path / "config.py",
-        project_path / "app" / "config.py",
-        project_path / "settings.py",
-        project_path / ".env",
-        project_path / "app.py"
-    ]
-    
     found_config = False
     
-    for config_file in config_files:
-        if config_file.exists():
-            issues = _analyze_config_file(config_file)
-            if issues:
-                report[config_file] = issues
-                found_config = True
+    for config_file in scan.config_files:
+        issues = _analyze_config_file(config_file)
+        if issues:
+            report[config_file] = issues
+            found_config = True
     
     if not found_config:
         report[project_path / "DATABASE_CONFIG"] = [
@@ -330,23 +471,31 @@ def _analyze_config_file(config_file: Path) -> List[str]:
     issues = []
     
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        # Python config files share the bytes read for the usage checks
+        content = source_bytes(config_file).decode("utf-8")
+        
+        # Collect every setting and marker in a single pass
+        found = set()
+        found_names = set()
+        for match in _CONFIG_SCAN.finditer(content):
+            # Every alternative is a named group, so a match always sets one
+            group = match.lastgroup or ""
+            found.add(group)
+            found_names.add(match.group(group))
         
         # Check for database URI
-        if not any(term in content.upper() for term in ["DATABASE_URI", "SQLALCHEMY_DATABASE_URI"]):
+        if "uri" not in found:
             issues.append("⚠️  No database URI configuration found")
         else:
             issues.append("✅ Database URI configuration present")
             
             # Check for hardcoded credentials
-            if any(term in content for term in ["password=", "passwd=", "://user:"]):
+            if "credentials" in found:
                 issues.append("🔐 Warning: Potential hardcoded database credentials")
                 issues.append("💡 Use environment variables: os.environ.get('DATABASE_URL')")
         
         # Check for connection pool settings
-        pool_settings = ["SQLALCHEMY_POOL_SIZE", "SQLALCHEMY_POOL_TIMEOUT", "SQLALCHEMY_MAX_OVERFLOW"]
-        found_pool_settings = [setting for setting in pool_settings if setting in content]
+        found_pool_settings = [setting for setting in _POOL_SETTINGS if setting in found_names]
         
         if found_pool_settings:
             issues.append(f"✅ Connection pool settings configured: {', '.join(found_pool_settings)}")
@@ -354,18 +503,12 @@ def _analyze_config_file(config_file: Path) -> List[str]:
             issues.append("💡 Consider configuring connection pool settings for production")
         
         # Check for SQLAlchemy settings
-        sqlalchemy_settings = [
-            "SQLALCHEMY_TRACK_MODIFICATIONS",
-            "SQLALCHEMY_ECHO",
-            "SQLALCHEMY_RECORD_QUERIES"
-        ]
-        
-        found_settings = [setting for setting in sqlalchemy_settings if setting in content]
+        found_settings = [setting for setting in _SQLALCHEMY_SETTINGS if setting in found_names]
         if found_settings:
             issues.append(f"✅ SQLAlchemy settings configured: {', '.join(found_settings)}")
         
         # Check for environment-based configuration
-        if "os.environ" in content or "getenv" in content:
+        if "env" in found:
             issues.append("✅ Environment-based configuration detected")
         else:
             issues.append("💡 Consider using environment variables for configuration")
@@ -376,41 +519,42 @@ def _analyze_config_file(config_file: Path) -> List[str]:
     return issues
 
 
-def _analyze_database_usage(project_path: Path) -> Dict[Path, List[str]]:
+def _analyze_database_usage(project_path: Path, scan: _ScanContext) -> Dict[Path, List[str]]:
     """Analyze database usage patterns in the codebase."""
     report = {}
     
-    # Find Python files that might use the database
-    python_files = list(project_path.glob("**/*.py"))
-    python_files = [f for f in python_files if "__pycache__" not in str(f)]
-    
+    # Each file is read once; the bytes are shared with the parse for the AST
+    # checks, and only files that use the database are decoded. Project-wide
+    # patterns are noted in the same pass, each only until it is first seen.
     db_usage_files = []
+    file_contents = []
+    saw_session_close = saw_bulk = saw_lazy = False
     
-    for file_path in python_files:
+    for file_path in scan.python_files:
+        # The walk only yields regular files, so reads fail only for
+        # permission errors, races with deletion or undecodable source
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            # Check if file uses database
-            db_patterns = [
-                "from flask_sqlalchemy",
-                "import sqlalchemy",
-                "db.session",
-                "query(",
-                ".filter(",
-                ".commit()",
-                ".rollback()"
-            ]
-            
-            if any(pattern in content for pattern in db_patterns):
-                db_usage_files.append(file_path)
+            data = source_bytes(file_path)
+        except OSError:
+            continue
         
-        except Exception:
+        # Check if file uses database
+        if not any(marker in data for marker in _DB_USAGE_MARKERS):
             continue
+        try:
+            content = data.decode("utf-8")
+        except UnicodeDecodeError:
+            continue
+        
+        db_usage_files.append(file_path)
+        file_contents.append(content)
+        saw_session_close = saw_session_close or "db.session.close()" in content
+        saw_bulk = saw_bulk or "bulk_insert" in content or "bulk_update" in content
+        saw_lazy = saw_lazy or "lazy=" in content
     
     # Analyze database usage in each file
-    for file_path in db_usage_files:
-        issues = _analyze_db_usage_file(file_path)
+    for file_path, content in zip(db_usage_files, file_contents):
+        issues = _analyze_db_usage_file(file_path, content)
         if issues:
             report[file_path] = issues
     
@@ -419,25 +563,16 @@ def _analyze_database_usage(project_path: Path) -> Dict[Path, List[str]]:
         overall_issues = []
         overall_issues.append(f"✅ Database usage detected in {len(db_usage_files)} file(s)")
         
-        # Check for common patterns across files
-        all_content = ""
-        for file_path in db_usage_files:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    all_content += f.read()
-            except Exception:
-                continue
-        
         # Check for session management
-        if "db.session.close()" not in all_content:
+        if not saw_session_close:
             overall_issues.append("💡 Consider explicit session management with db.session.close()")
         
         # Check for bulk operations
-        if "bulk_insert" in all_content or "bulk_update" in all_content:
+        if saw_bulk:
             overall_issues.append("✅ Bulk operations detected - good for performance")
         
         # Check for lazy loading
-        if "lazy=" in all_content:
+        if saw_lazy:
             overall_issues.append("✅ Lazy loading configuration detected")
         
         report[project_path / "DATABASE_USAGE"] = overall_issues
@@ -445,41 +580,37 @@ def _analyze_database_usage(project_path: Path) -> Dict[Path, List[str]]:
     return report
 
 
-def _analyze_db_usage_file(file_path: Path) -> List[str]:
-    """Analyze database usage in a single file."""
+def _analyze_db_usage_file(file_path: Path, content: str) -> List[str]:
+    """Analyze database usage in a single file, given its decoded source."""
     issues = []
     
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        tree = ast.parse(content)
-        visitor = DatabaseVisitor(file_path)
-        visitor.visit(tree)
+        visitor = file_observers(file_path)["database"]
+        present = {marker for marker in _DB_FILE_MARKERS if marker in content}
         
         # Check query patterns
         if visitor.query_patterns:
             issues.append(f"✅ Found {len(visitor.query_patterns)} database query pattern(s)")
             
             # Check for N+1 query problems
-            if content.count(".query") > 5 and "join" not in content.lower():
+            if content.count(".query") > 5 and not _JOIN_RE.search(content):
                 issues.append("⚠️  Potential N+1 query problem - consider using joins")
         
         # Check transaction handling
         if visitor.transactions:
             issues.append(f"✅ Transaction handling detected ({len(visitor.transactions)} patterns)")
-        elif any(pattern in content for pattern in ["db.session.add", "db.session.delete"]):
+        elif "db.session.add" in present or "db.session.delete" in present:
             issues.append("⚠️  Database modifications without explicit transaction handling")
         
         # Check for raw SQL
-        if "execute(" in content and any(quote in content for quote in ['"SELECT', "'SELECT", '"INSERT', "'INSERT"]):
+        if "execute(" in present and not _RAW_SQL_MARKERS.isdisjoint(present):
             issues.append("⚠️  Raw SQL detected - consider using SQLAlchemy ORM")
             issues.append("🔐 Ensure raw SQL is protected against injection attacks")
         
         # Check for proper error handling
-        if "try:" in content and any(db_op in content for db_op in ["db.session.commit", "query"]):
+        if "try:" in present and ("db.session.commit" in present or "query" in present):
             issues.append("✅ Error handling around database operations detected")
-        elif any(db_op in content for db_op in ["db.session.commit", "db.session.add"]):
+        elif "db.session.commit" in present or "db.session.add" in present:
             issues.append("💡 Consider adding error handling around database operations")
         
     except Exception as e:
@@ -488,7 +619,7 @@ def _analyze_db_usage_file(file_path: Path) -> List[str]:
     return issues
 
 
-def _analyze_query_patterns(project_path: Path) -> Dict[Path, List[str]]:
+def _analyze_query_patterns(project_path: Path, scan: _ScanContext) -> Dict[Path, List[str]]:
     """Analyze query patterns for optimization opportunities."""
     report = {}
     
@@ -497,18 +628,16 @@ def _analyze_query_patterns(project_path: Path) -> Dict[Path, List[str]]:
     
     query_issues = []
     
-    # Look for model files to understand relationships
-    model_files = list(project_path.glob("**/models/*.py"))
-    model_files.extend(project_path.glob("**/models.py"))
+    # Model files show the relationships between tables
+    model_files = scan.model_files
     
     if model_files:
         relationship_count = 0
         for model_file in model_files:
             try:
-                with open(model_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                relationship_count += content.count("relationship(")
-            except Exception:
+                # Counted on raw bytes already read for the usage checks
+                relationship_count += source_bytes(model_file).count(b"relationship(")
+            except OSError:
                 continue
         
         if relationship_count > 0:
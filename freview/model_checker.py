@@ -1,11 +1,39 @@
 import ast
+import json
+import os
 import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Set, Optional
-from dataclasses import dataclass
-
-
-@dataclass
+from typing import Any, Dict, List, Set, Optional, Tuple
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+
+from ._ast_cache import CompositeVisitor, file_observers, is_decode_error, register_observer
+
+# Directories whose entries decide which model files are found: the model
+# packages and the parents of the single-module locations
+_MODEL_SEARCH_DIRS = (
+    (),
+    ("app",),
+    ("src",),
+    ("models",),
+    ("app", "models"),
+    ("src", "models"),
+    ("application", "models"),
+)
+
+# Per-file results cache. Bump the version whenever per-file analysis changes
+# so results from older releases are not reused. Stored as JSON rather than
+# pickle, since the cache lives in the reviewed project and may not be trusted.
+_CACHE_VERSION = 1
+_CACHE_FILE_NAME = "models.json"
+
+# Naming conventions for model class names and table names
+_PASCAL_RE = re.compile(r"^[A-Z][a-zA-Z0-9]+$")
+_SNAKE_RE = re.compile(r"^[a-z][a-z0-9_]*$")
+
+
+@dataclass(slots=True)
 class ModelInfo:
     """Information about a SQLAlchemy model class."""
 
@@ -28,15 +56,33 @@ class ModelInfo:
             self.base_classes = []
 
 
-class ModelVisitor(ast.NodeVisitor):
-    """Enhanced AST visitor for SQLAlchemy model analysis."""
+class ModelVisitor:
+    """
+    Enhanced AST observer for SQLAlchemy model analysis.
+
+    Hooks follow the observer protocol in ``freview._ast_cache`` so the visitor
+    can share a walk with the other analyzers; ``visit`` runs it on its own.
+    """
 
     def __init__(self, file_path: Path):
-        self.issues = []
+        self.issues: List[str] = []
         self.models: List[ModelInfo] = []
         self.imports: Set[str] = set()
         self.current_file = file_path
         self.class_methods: Dict[str, List[str]] = {}
+        # Handlers for calls assigned in a model body, keyed by the called attribute
+        self._call_handlers = {
+            "Column": self._analyze_column,
+            "relationship": self._analyze_relationship,
+        }
+
+    def visit(self, tree: ast.AST):
+        """Walk a tree with only this visitor attached."""
+        CompositeVisitor([self]).visit(tree)
+
+    def wants_expressions(self):
+        """Every hook is on a statement, so expressions are never needed."""
+        return False
 
     def visit_Import(self, node):
         """Track regular imports."""
@@ -72,8 +118,7 @@ class ModelVisitor(ast.NodeVisitor):
         )
 
         if not is_model:
-            # Continue visiting for nested classes
-            self.generic_visit(node)
+            # Nested classes are still visited by the walk
             return
 
         # Create model info
@@ -88,9 +133,6 @@ class ModelVisitor(ast.NodeVisitor):
         # Generate issues for this model
         self._generate_model_issues(model_info)
 
-        # Continue visiting
-        self.generic_visit(node)
-
     def _analyze_model_class(self, node: ast.ClassDef, model_info: ModelInfo):
         """Analyze the contents of a model class."""
         methods = []
@@ -116,10 +158,6 @@ class ModelVisitor(ast.NodeVisitor):
                     if isinstance(stmt.value, ast.Constant):
                         if isinstance(stmt.value.value, str):
                             model_info.tablename = stmt.value.value
-                    # Fallback for older Python versions
-                    elif hasattr(stmt.value, "s"):  # ast.Str (deprecated)
-                        if isinstance(stmt.value.s, str):
-                            model_info.tablename = stmt.value.s
 
                 # Check for Column definitions
                 elif isinstance(stmt.value, ast.Call):
@@ -128,52 +166,50 @@ class ModelVisitor(ast.NodeVisitor):
     def _analyze_column_call(self, call: ast.Call, model_info: ModelInfo, var_name: str):
         """Analyze Column() and relationship() calls."""
         if isinstance(call.func, ast.Attribute):
-            func_name = call.func.attr
-
-            if func_name == "Column":
-                model_info.has_columns = True
-
-                # Check for primary key
-                for keyword in call.keywords:
-                    if (
-                        keyword.arg == "primary_key"
-                        and isinstance(keyword.value, ast.Constant)
-                        and keyword.value.value is True
-                    ):
-                        model_info.has_primary_key = True
-
-                # Check for foreign keys in column args
-                for arg in call.args:
-                    if isinstance(arg, ast.Call) and isinstance(arg.func, ast.Attribute):
-                        if arg.func.attr == "ForeignKey":
-                            if arg.args and isinstance(arg.args[0], (ast.Str, ast.Constant)):
-                                fk_ref = (
-                                    arg.args[0].s
-                                    if isinstance(arg.args[0], ast.Str)
-                                    else arg.args[0].value
-                                )
-                                model_info.foreign_keys.append(fk_ref)
-
-            elif func_name == "relationship":
-                # Extract relationship target
-                if call.args and isinstance(call.args[0], (ast.Str, ast.Constant)):
-                    rel_target = (
-                        call.args[0].s if isinstance(call.args[0], ast.Str) else call.args[0].value
-                    )
-                    model_info.relationships.append(rel_target)
+            handler = self._call_handlers.get(call.func.attr)
+            if handler is not None:
+                handler(call, model_info)
+
+    def _analyze_column(self, call: ast.Call, model_info: ModelInfo):
+        """Record a Column() call's primary key and foreign keys."""
+        model_info.has_columns = True
+
+        # Check for primary key; keyword names are unique, so stop at the first match
+        for keyword in call.keywords:
+            if keyword.arg == "primary_key":
+                if isinstance(keyword.value, ast.Constant) and keyword.value.value is True:
+                    model_info.has_primary_key = True
+                break
+
+        # Check for foreign keys in column args
+        for arg in call.args:
+            if isinstance(arg, ast.Call) and isinstance(arg.func, ast.Attribute):
+                if arg.func.attr == "ForeignKey":
+                    if arg.args and isinstance(arg.args[0], ast.Constant):
+                        model_info.foreign_keys.append(arg.args[0].value)
+
+    def _analyze_relationship(self, call: ast.Call, model_info: ModelInfo):
+        """Record a relationship() call's target model."""
+        if call.args and isinstance(call.args[0], ast.Constant):
+            rel_target = call.args[0].value
+            # Class names from the parser are interned already; interning
+            # targets too makes name lookups identity comparisons
+            if isinstance(rel_target, str):
+                rel_target = sys.intern(rel_target)
+            model_info.relationships.append(rel_target)
 
     def _generate_model_issues(self, model_info: ModelInfo):
         """Generate issues for a model based on analysis."""
         class_name = model_info.name
 
         # Naming convention checks
-        if not re.match(r"^[A-Z][a-zA-Z0-9]+$", class_name):
+        if not _PASCAL_RE.match(class_name):
             self.issues.append(f"⚠️ {class_name}: Class name should be PascalCase")
 
         # Core requirements
         if not model_info.has_tablename:
             self.issues.append(f"❌ {class_name}: Missing __tablename__ attribute")
-        elif model_info.tablename and not re.match(r"^[a-z][a-z0-9_]*$", model_info.tablename):
+        elif model_info.tablename and not _SNAKE_RE.match(model_info.tablename):
             self.issues.append(f"⚠️ {class_name}: __tablename__ should be snake_case")
 
         if not model_info.has_columns:
@@ -214,12 +250,17 @@ class ModelVisitor(ast.NodeVisitor):
             self.issues.append(f"ℹ️ {class_name}: Inherits from {', '.join(interesting_bases)}")
 
 
-def analyze_models(project_path: Path) -> Dict[Path, List[str]]:
+register_observer("models", ModelVisitor)
+
+
+def analyze_models(project_path: Path, cache_dir: Optional[Path] = None) -> Dict[Path, List[str]]:
     """
     Analyze SQLAlchemy models in a Flask project.
 
     Args:
         project_path: Path to the Flask project root
+        cache_dir: Directory to keep per-file results in between runs; files
+            whose modification time and size are unchanged are not re-analyzed
 
     Returns:
         Dictionary mapping file paths to lists of issues found
@@ -234,26 +275,30 @@ def analyze_models(project_path: Path) -> Dict[Path, List[str]]:
         # No model files found
         return {project_path: ["⚠️ No Python model files found in the project"]}
 
-    # Analyze each model file
+    # Reuse cached results for unchanged files
+    cached = _load_cached_results(cache_dir) if cache_dir else {}
+    stats: Dict[Path, Tuple[int, int]] = {}
+    results: List[Tuple[Path, List[str], List[ModelInfo]]] = []
+    stale = False
     for file_path in model_files:
         try:
-            visitor = ModelVisitor(file_path)
-            tree = ast.parse(file_path.read_text(encoding="utf-8"))
-            visitor.visit(tree)
-
-            all_models.extend(visitor.models)
-
-            if visitor.issues:
-                report[file_path] = visitor.issues
-            else:
-                report[file_path] = ["ℹ️ No SQLAlchemy models found in this file"]
-
-        except SyntaxError as e:
-            report[file_path] = [f"❌ Syntax error: {e.msg} at line {e.lineno}"]
-        except UnicodeDecodeError:
-            report[file_path] = ["❌ Unable to read file - encoding issues"]
-        except Exception as e:
-            report[file_path] = [f"❌ Error analyzing file: {str(e)}"]
+            stat = os.stat(file_path)
+            stats[file_path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+        result = _cached_file_result(cached.get(str(file_path)), file_path, stats.get(file_path))
+        if result is None:
+            result = _analyze_model_file(file_path)
+            stale = True
+        results.append(result)
+
+    # Save before cross-model analysis appends to the per-file issues
+    if cache_dir and stale:
+        _save_cached_results(cache_dir, results, stats)
+
+    for file_path, issues, models in results:
+        report[file_path] = issues
+        all_models.extend(models)
 
     # Cross-model analysis
     _analyze_model_relationships(all_models, report, project_path)
@@ -261,8 +306,120 @@ def analyze_models(project_path: Path) -> Dict[Path, List[str]]:
     return report
 
 
+def _analyze_model_file(file_path: Path) -> Tuple[Path, List[str], List[ModelInfo]]:
+    """Analyze a single model file, returning its issues and the models it defines."""
+    try:
+        visitor = file_observers(file_path)["models"]
+
+        # Copy the shared visitor's issues; cross-model checks append to them
+        if visitor.issues:
+            return file_path, list(visitor.issues), visitor.models
+        return file_path, ["ℹ️ No SQLAlchemy models found in this file"], visitor.models
+
+    except SyntaxError as e:
+        if is_decode_error(e):
+            return file_path, ["❌ Unable to read file - encoding issues"], []
+        return file_path, [f"❌ Syntax error: {e.msg} at line {e.lineno}"], []
+    except UnicodeDecodeError:
+        return file_path, ["❌ Unable to read file - encoding issues"], []
+    except Exception as e:
+        return file_path, [f"❌ Error analyzing file: {str(e)}"], []
+
+
+def _load_cached_results(cache_dir: Path) -> Dict[str, Any]:
+    """Load cached per-file results, ignoring caches that are missing, unreadable or outdated."""
+    try:
+        data = json.loads((cache_dir / _CACHE_FILE_NAME).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _cached_file_result(
+    entry: Any, file_path: Path, stat: Optional[Tuple[int, int]]
+) -> Optional[Tuple[Path, List[str], List[ModelInfo]]]:
+    """
+    Rebuild a file's result from its cache entry.
+
+    Returns None when the file has changed since it was cached or the entry is
+    malformed, so the file is analyzed again instead.
+    """
+    if not isinstance(entry, dict) or stat is None:
+        return None
+    mtime_ns, size = entry.get("mtime_ns"), entry.get("size")
+    if not isinstance(mtime_ns, int) or not isinstance(size, int) or (mtime_ns, size) != stat:
+        return None
+    issues, models = entry.get("issues"), entry.get("models")
+    if not isinstance(issues, list) or not isinstance(models, list):
+        return None
+    try:
+        model_infos = [ModelInfo(**{**model, "file_path": file_path}) for model in models]
+    except TypeError:
+        # Entries that are not mappings or have unknown or missing fields
+        return None
+    return file_path, list(issues), model_infos
+
+
+def _save_cached_results(
+    cache_dir: Path,
+    results: List[Tuple[Path, List[str], List[ModelInfo]]],
+    stats: Dict[Path, Tuple[int, int]],
+) -> None:
+    """Store per-file results for the files that could be stat'ed; failures are ignored."""
+    files = {}
+    for file_path, issues, models in results:
+        if file_path not in stats:
+            continue
+        mtime_ns, size = stats[file_path]
+        files[str(file_path)] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "issues": issues,
+            "models": [
+                {name: value for name, value in asdict(model).items() if name != "file_path"}
+                for model in models
+            ],
+        }
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial cache
+        temp_path = cache_dir / f"{_CACHE_FILE_NAME}.{os.getpid()}.tmp"
+        temp_path.write_text(
+            json.dumps({"version": _CACHE_VERSION, "files": files}), encoding="utf-8"
+        )
+        os.replace(temp_path, cache_dir / _CACHE_FILE_NAME)
+    except (OSError, TypeError, ValueError):
+        # Unwritable directories and values JSON cannot hold just skip caching
+        pass
+
+
 def _find_model_files(project_path: Path) -> List[Path]:
-    """Find Python files that might contain SQLAlchemy models."""
+    """
+    Find Python files that might contain SQLAlchemy models.
+
+    Only a few fixed directories are listed, so results are cached on their
+    modification times; adding, removing or renaming an entry in any of them
+    changes the key.
+    """
+    signature = tuple(_mtime_ns(project_path.joinpath(*parts)) for parts in _MODEL_SEARCH_DIRS)
+    return list(_model_files(project_path, signature))
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of a path, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _model_files(project_path: Path, signature: Tuple[Optional[int], ...]) -> Tuple[Path, ...]:
+    """Search the model locations for a given state of their directories."""
     model_files: List[Path] = []
 
     # Look in common model directories
@@ -288,9 +445,8 @@ def _find_model_files(project_path: Path) -> List[Path]:
         if file_path.exists():
             model_files.append(file_path)
 
-    # Remove __init__.py files and duplicates
-    model_files = [f for f in model_files if f.name != "__init__.py"]
-    return list(set(model_files))
+    # Remove __init__.py files and duplicates, keeping the search order
+    return tuple(dict.fromkeys(f for f in model_files if f.name != "__init__.py"))
 
 
 def _analyze_model_relationships(
@@ -309,13 +465,14 @@ def _analyze_model_relationships(
 
     unused_models = model_names - referenced_models
 
-    # Add unused model warnings to the first file (arbitrary choice)
-    if unused_models and models:
-        first_file = models[0].file_path
-        for unused in sorted(unused_models):
-            report.setdefault(first_file, []).append(
-                f"⚠️ Model '{unused}' is not referenced in any relationships"
-            )
+    # Report each unused model once, in the file that first defines it
+    defining_files: Dict[str, Path] = {}
+    for model in models:
+        defining_files.setdefault(model.name, model.file_path)
+    for unused in sorted(unused_models):
+        report.setdefault(defining_files[unused], []).append(
+            f"⚠️ Model '{unused}' is not referenced in any relationships"
+        )
 
     # Check for potential relationship issues
     for model in models:
@@ -325,18 +482,73 @@ def _analyze_model_relationships(
                     f"⚠️ {model.name}: Relationship target '{rel_target}' not found in analyzed models"
                 )
 
-    # Simple circular dependency detection
-    model_deps = {}
+    # Circular dependencies: every strongly connected group of related models
+    model_deps: Dict[str, List[str]] = {}
     for model in models:
-        model_deps[model.name] = set(model.relationships)
-
-    # Find cycles (basic implementation)
-    for model_name, deps in model_deps.items():
-        for dep in deps:
-            if dep in model_deps and model_name in model_deps[dep]:
-                # Found a circular dependency
-                model_file = next((m.file_path for m in models if m.name == model_name), None)
-                if model_file:
-                    report.setdefault(model_file, []).append(
-                        f"⚠️ Potential circular relationship between '{model_name}' and '{dep}'"
-                    )
+        model_deps.setdefault(model.name, []).extend(model.relationships or ())
+
+    # Each cycle is reported once, in the file defining its alphabetically first model
+    for component in _strongly_connected_components(model_deps):
+        if len(component) < 2:
+            continue
+        names = sorted(component)
+        if len(names) == 2:
+            first, second = names
+            message = f"⚠️ Potential circular relationship between '{first}' and '{second}'"
+        else:
+            listed = ", ".join(f"'{name}'" for name in names)
+            message = f"⚠️ Potential circular relationship among {listed}"
+        report.setdefault(defining_files[names[0]], []).append(message)
+
+
+def _strongly_connected_components(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Find the strongly connected components of a directed graph with Tarjan's algorithm.
+
+    Edges to names that are not keys of the graph are ignored. Components are
+    returned in the order they complete, each listing its members in graph order.
+    """
+    order = {name: position for position, name in enumerate(graph)}
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    components: List[List[str]] = []
+
+    for root in graph:
+        if root in index:
+            continue
+        # Iterative depth-first search; each frame is a node and its pending edges
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        frames = [(root, iter(graph[root]))]
+        while frames:
+            node, edges = frames[-1]
+            for target in edges:
+                if target not in graph:
+                    continue
+                if target not in index:
+                    index[target] = lowlink[target] = len(index)
+                    stack.append(target)
+                    on_stack.add(target)
+                    frames.append((target, iter(graph[target])))
+                    break
+                if target in on_stack:
+                    lowlink[node] = min(lowlink[node], index[target])
+            else:
+                frames.pop()
+                if frames:
+                    parent = frames[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component, key=order.__getitem__))
+
+    return components
@@ -1,7 +1,10 @@
+import os
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import tomllib
 
+from .config import iter_py_files
+
 
 def analyze_project_structure(project_path: Path) -> List[str]:
     """
@@ -15,44 +18,96 @@ def analyze_project_structure(project_path: Path) -> List[str]:
     """
     issues: list[str] = []
 
+    # Every check below probes fixed paths; each directory is listed once
+    entries = _DirectoryEntries(project_path)
+
     # Check for Flask application entry points
-    _check_entry_points(project_path, issues)
+    _check_entry_points(entries, issues)
 
     # Check for models organization
-    _check_models_structure(project_path, issues)
+    _check_models_structure(entries, issues)
 
     # Check for templates and static files
-    _check_template_static_structure(project_path, issues)
+    _check_template_static_structure(entries, issues)
 
     # Check for configuration management
-    _check_configuration(project_path, issues)
+    _check_configuration(entries, issues)
 
     # Check for blueprints organization
-    _check_blueprints_structure(project_path, issues)
+    _check_blueprints_structure(entries, issues)
 
     # Check for testing structure
-    _check_testing_structure(project_path, issues)
+    _check_testing_structure(entries, issues)
 
     # Check for documentation
-    _check_documentation(project_path, issues)
+    _check_documentation(entries, issues)
 
     return issues
 
 
-def _check_entry_points(project_path: Path, issues: List[str]) -> None:
+class _DirectoryEntries:
+    """
+    Names in a project's directories, with each directory listed at most once.
+
+    Probes for names found in the listing are answered without a stat() call.
+    Other names fall back to Path.exists() and Path.is_dir(), which keeps their
+    case-insensitive matching on macOS and Windows. Paths are given as name
+    parts relative to the root.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._listings: Dict[Tuple[str, ...], Dict[str, bool]] = {}
+
+    def listing(self, *parts: str) -> Dict[str, bool]:
+        """Map each name in a directory to whether it is a directory itself."""
+        listing = self._listings.get(parts)
+        if listing is None:
+            listing = {}
+            # Only paths that are directories are scanned
+            if not parts or self.is_dir(*parts):
+                try:
+                    with os.scandir(self.root.joinpath(*parts)) as dir_entries:
+                        for entry in dir_entries:
+                            try:
+                                # Dangling symlinks are left to the Path fallback
+                                if entry.is_symlink() and not os.path.exists(entry.path):
+                                    continue
+                                listing[entry.name] = entry.is_dir()
+                            except OSError:
+                                listing[entry.name] = False
+                except OSError:
+                    pass
+            self._listings[parts] = listing
+        return listing
+
+    def exists(self, *parts: str) -> bool:
+        """Check whether a path exists."""
+        if parts[-1] in self.listing(*parts[:-1]):
+            return True
+        return self.root.joinpath(*parts).exists()
+
+    def is_dir(self, *parts: str) -> bool:
+        """Check whether a path is a directory."""
+        found = self.listing(*parts[:-1]).get(parts[-1])
+        if found is not None:
+            return found
+        return self.root.joinpath(*parts).is_dir()
+
+
+def _check_entry_points(entries: _DirectoryEntries, issues: List[str]) -> None:
     """Check for Flask application entry points."""
     entry_files = ["app.py", "run.py", "main.py", "wsgi.py"]
     app_dirs = ["app", "src", "application"]
 
     # Check for entry files in root
-    found_entry = any((project_path / f).exists() for f in entry_files)
+    found_entry = any(entries.exists(f) for f in entry_files)
 
     # Check for entry files in common app directories
     if not found_entry:
         for app_dir in app_dirs:
-            app_path = project_path / app_dir
-            if app_path.exists() and app_path.is_dir():
-                if any((app_path / f).exists() for f in entry_files):
+            if entries.is_dir(app_dir):
+                if any(entries.exists(app_dir, f) for f in entry_files):
                     found_entry = True
                     break
 
@@ -62,34 +117,32 @@ def _check_entry_points(project_path: Path, issues: List[str]) -> None:
         )
 
 
-def _check_models_structure(project_path: Path, issues: List[str]) -> None:
+def _check_models_structure(entries: _DirectoryEntries, issues: List[str]) -> None:
     """Check for SQLAlchemy models organization."""
     model_locations = [
-        project_path / "models",
-        project_path / "app" / "models",
-        project_path / "src" / "models",
-        project_path / "application" / "models",
+        ("models",),
+        ("app", "models"),
+        ("src", "models"),
+        ("application", "models"),
     ]
 
     models_found = False
     for model_dir in model_locations:
-        if model_dir.exists() and model_dir.is_dir():
+        if entries.is_dir(*model_dir):
             models_found = True
-            if not (model_dir / "__init__.py").exists():
-                issues.append(
-                    f"Missing '__init__.py' in '{model_dir.relative_to(project_path)}' directory"
-                )
+            if not entries.exists(*model_dir, "__init__.py"):
+                issues.append(f"Missing '__init__.py' in '{Path(*model_dir)}' directory")
             break
 
     # Also check for single models.py file
     single_model_files = [
-        project_path / "models.py",
-        project_path / "app" / "models.py",
-        project_path / "src" / "models.py",
+        ("models.py",),
+        ("app", "models.py"),
+        ("src", "models.py"),
     ]
 
     if not models_found:
-        if any(f.exists() for f in single_model_files):
+        if any(entries.exists(*f) for f in single_model_files):
             models_found = True
 
     if not models_found:
@@ -98,83 +151,77 @@ def _check_models_structure(project_path: Path, issues: List[str]) -> None:
         )
 
 
-def _check_template_static_structure(project_path: Path, issues: List[str]) -> None:
+def _check_template_static_structure(entries: _DirectoryEntries, issues: List[str]) -> None:
     """Check for templates and static files organization."""
     template_locations = [
-        project_path / "templates",
-        project_path / "app" / "templates",
-        project_path / "src" / "templates",
+        ("templates",),
+        ("app", "templates"),
+        ("src", "templates"),
     ]
 
     static_locations = [
-        project_path / "static",
-        project_path / "app" / "static",
-        project_path / "src" / "static",
+        ("static",),
+        ("app", "static"),
+        ("src", "static"),
     ]
 
     # Check templates
-    if not any(loc.exists() for loc in template_locations):
+    if not any(entries.exists(*loc) for loc in template_locations):
         issues.append("Missing 'templates/' directory - required for Flask template rendering")
 
     # Check static files
-    if not any(loc.exists() for loc in static_locations):
+    if not any(entries.exists(*loc) for loc in static_locations):
         issues.append("Missing 'static/' directory - recommended for CSS, JS, and image files")
 
 
-def _check_configuration(project_path: Path, issues: List[str]) -> None:
+def _check_configuration(entries: _DirectoryEntries, issues: List[str]) -> None:
     """Check for configuration management."""
     config_files = [
-        project_path / "config.py",
-        project_path / "settings.py",
-        project_path / "app" / "config.py",
-        project_path / "src" / "config.py",
+        ("config.py",),
+        ("settings.py",),
+        ("app", "config.py"),
+        ("src", "config.py"),
     ]
 
     env_files = [
-        project_path / ".env",
-        project_path / ".env.example",
-        project_path / "environment.yaml",
+        (".env",),
+        (".env.example",),
+        ("environment.yaml",),
     ]
 
-    has_config = any(f.exists() for f in config_files)
-    has_env = any(f.exists() for f in env_files)
+    has_config = any(entries.exists(*f) for f in config_files)
+    has_env = any(entries.exists(*f) for f in env_files)
 
     if not has_config and not has_env:
         issues.append("Missing configuration management - consider adding config.py or .env file")
 
     # Check for requirements management
-    req_files = [
-        project_path / "requirements.txt",
-        project_path / "pyproject.toml",
-        project_path / "Pipfile",
-        project_path / "poetry.lock",
-    ]
+    req_files = ["requirements.txt", "pyproject.toml", "Pipfile", "poetry.lock"]
 
-    if not any(f.exists() for f in req_files):
+    if not any(entries.exists(f) for f in req_files):
         issues.append(
             "Missing dependency management file - consider adding requirements.txt or pyproject.toml"
         )
 
 
-def _check_blueprints_structure(project_path: Path, issues: List[str]) -> None:
+def _check_blueprints_structure(entries: _DirectoryEntries, issues: List[str]) -> None:
     """Check for Flask blueprints organization."""
     blueprint_indicators = []
 
     # Look for common blueprint patterns
     common_dirs = ["views", "blueprints", "api", "admin", "auth"]
-    app_dirs = [project_path, project_path / "app", project_path / "src"]
+    app_dirs = [(), ("app",), ("src",)]
 
     for app_dir in app_dirs:
-        if not app_dir.exists():
+        if app_dir and not entries.exists(*app_dir):
             continue
 
         for bp_dir in common_dirs:
-            bp_path = app_dir / bp_dir
-            if bp_path.exists() and bp_path.is_dir():
+            bp_path = (*app_dir, bp_dir)
+            if entries.is_dir(*bp_path):
                 # Check if directory contains Python files (potential blueprints)
-                py_files = list(bp_path.glob("*.py"))
-                if py_files:
-                    blueprint_indicators.append(bp_path)
+                if any(name.endswith(".py") for name in entries.listing(*bp_path)):
+                    blueprint_indicators.append(entries.root.joinpath(*bp_path))
 
     # This is informational rather than an issue
     if blueprint_indicators:
@@ -182,35 +229,32 @@ def _check_blueprints_structure(project_path: Path, issues: List[str]) -> None:
         pass  # Not adding as issue since blueprints are optional
 
 
-def _check_testing_structure(project_path: Path, issues: List[str]) -> None:
+def _check_testing_structure(entries: _DirectoryEntries, issues: List[str]) -> None:
     """Check for testing setup."""
-    test_locations = [
-        project_path / "tests",
-        project_path / "test",
-        project_path / "testing",
-    ]
+    test_locations = ["tests", "test", "testing"]
 
-    test_files = list(project_path.rglob("test_*.py")) + list(project_path.rglob("*_test.py"))
+    # The project is only walked for test files when there is no test directory
+    has_tests = any(entries.is_dir(loc) for loc in test_locations) or any(
+        file_path.name.startswith("test_") or file_path.name.endswith("_test.py")
+        for file_path in iter_py_files(entries.root)
+    )
 
-    has_test_dir = any(loc.exists() and loc.is_dir() for loc in test_locations)
-    has_test_files = len(test_files) > 0
-
-    if not has_test_dir and not has_test_files:
+    if not has_tests:
         issues.append(
             "No testing structure found - consider adding a 'tests/' directory with test files"
         )
 
 
-def _check_documentation(project_path: Path, issues: List[str]) -> None:
+def _check_documentation(entries: _DirectoryEntries, issues: List[str]) -> None:
     """Check for basic documentation."""
     doc_files = [
-        project_path / "README.md",
-        project_path / "README.rst",
-        project_path / "README.txt",
-        project_path / "docs" / "README.md",
+        ("README.md",),
+        ("README.rst",),
+        ("README.txt",),
+        ("docs", "README.md"),
     ]
 
-    if not any(f.exists() for f in doc_files):
+    if not any(entries.exists(*f) for f in doc_files):
         issues.append("Missing README file - consider adding project documentation")
 
 
@@ -224,23 +268,23 @@ def get_project_info(project_path: Path) -> Dict[str, any]:
     info = {
         "name": project_path.name,
         "path": str(project_path),
-        "python_files": list(project_path.rglob("*.py")),
+        "python_files": list(iter_py_files(project_path)),
         "has_flask": False,
         "flask_version": None,
         "dependencies": [],
         "structure_type": "unknown",
     }
 
-    # Check for Flask imports in Python files
-    flask_patterns = ["from flask import", "import flask"]
+    # Check for Flask imports in Python files, on raw bytes so nothing is decoded
+    flask_patterns = [b"from flask import", b"import flask"]
     for py_file in info["python_files"][:10]:  # Check first 10 files for performance
         try:
-            content = py_file.read_text(encoding="utf-8")
-            if any(pattern in content for pattern in flask_patterns):
-                info["has_flask"] = True
-                break
-        except (UnicodeDecodeError, PermissionError):
+            content = py_file.read_bytes()
+        except PermissionError:
             continue
+        if any(pattern in content for pattern in flask_patterns):
+            info["has_flask"] = True
+            break
 
     # Try to read dependencies
     pyproject_path = project_path / "pyproject.toml"
@@ -1,7 +1,87 @@
 import json
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+try:
+    # Optional, faster JSON encoder (the "fast" extra); output matches the json module's
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Issue categories for each report section, in display order: the heading and
+# the prefixes that mark an issue as belonging to it
+_MODEL_ISSUE_GROUPS = (
+    ("Errors", ("❌",)),
+    ("Warnings", ("⚠️",)),
+    ("Information", ("ℹ️",)),
+    ("Passed Checks", ("✅",)),
+)
+_API_ISSUE_GROUPS = (
+    ("Errors", ("❌",)),
+    ("Warnings", ("⚠️",)),
+    ("Security & Best Practices", ("🔐", "🛡️")),
+    ("Recommendations", ("💡",)),
+    ("Passed Checks", ("✅",)),
+)
+_DATABASE_ISSUE_GROUPS = (
+    ("Errors", ("❌",)),
+    ("Warnings", ("⚠️",)),
+    ("Security", ("🔐",)),
+    ("Recommendations", ("💡",)),
+    ("Information", ("ℹ️",)),
+    ("Passed Checks", ("✅",)),
+)
+
+# Joins the issues of one category into a Markdown list
+_ISSUE_SEPARATOR = "\n- "
+
+# Recommendations keyed by the issue marker that triggers them. The first item
+# indexes the report searched: 0 structure, 1 models, 2 API, 3 database
+_RECOMMENDATIONS = (
+    # Structure recommendations
+    (0, "Missing entry file",
+     "- Create a main application entry point (app.py, run.py, or main.py) to bootstrap your Flask application."),
+    (0, "Missing 'models/'",
+     "- Create a dedicated 'models/' directory to organize your SQLAlchemy models."),
+    (0, "configuration file",
+     "- Add configuration management with either a config.py file or .env file for environment variables."),
+    # Model recommendations
+    (1, "Missing __tablename__",
+     "- Add __tablename__ attribute to all SQLAlchemy models to explicitly define table names."),
+    (1, "No primary key defined",
+     "- Ensure all models have a primary key field, typically an 'id' column with primary_key=True."),
+    (1, "Circular import detected",
+     "- Resolve circular imports by using string-based relationship definitions or restructuring your models."),
+    # API recommendations
+    (2, "may need authentication",
+     "- Implement authentication for sensitive API endpoints using Flask-Login, JWT, or similar."),
+    (2, "should validate input",
+     "- Add input validation to API endpoints using Flask-WTF, marshmallow, or similar libraries."),
+    (2, "should include error handling",
+     "- Implement proper error handling in API routes with try-catch blocks and meaningful error responses."),
+    (2, "Consider API versioning",
+     "- Implement API versioning (e.g., /api/v1/) for better API evolution and backward compatibility."),
+    # Database recommendations
+    (3, "No migrations directory found",
+     "- Set up database migrations with Flask-Migrate: pip install Flask-Migrate && flask db init"),
+    (3, "No database configuration found",
+     "- Configure database connection in config.py with SQLALCHEMY_DATABASE_URI."),
+    (3, "hardcoded database credentials",
+     "- Move database credentials to environment variables for security."),
+    (3, "N+1 query problem",
+     "- Optimize database queries by using joins and eager loading to avoid N+1 query problems."),
+)
+
+_GENERAL_RECOMMENDATIONS = (
+    "- Consider using Flask-Migrate for database migrations.",
+    "- Implement model validation using SQLAlchemy validators or Flask-WTF.",
+    "- Add comprehensive docstrings to your models and methods.",
+    "- Consider implementing model mixins for common functionality (timestamps, soft deletes, etc.).",
+)
 
 
 def write_markdown_report(
@@ -9,9 +89,15 @@ def write_markdown_report(
     structure_issues: List[str], 
     model_report: Dict[Path, List[str]],
     api_report: Dict[Path, List[str]] = None,
-    db_report: Dict[Path, List[str]] = None
+    db_report: Dict[Path, List[str]] = None,
+    generated_at: Optional[datetime] = None
 ) -> Path:
-    """Write a comprehensive Markdown report."""
+    """
+    Write a comprehensive Markdown report.
+
+    Pass the same generated_at to each report writer so their timestamps agree;
+    it defaults to the current time.
+    """
     if api_report is None:
         api_report = {}
     if db_report is None:
@@ -19,215 +105,171 @@ def write_markdown_report(
         
     report_path = output_path / "freview_report.md"
 
-    with report_path.open("w") as f:
-        f.write("# Flask Project Review Report\n\n")
-        f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-        # Summary section
-        total_issues = (len(structure_issues) + 
-                       sum(len(issues) for issues in model_report.values()) +
-                       sum(len(issues) for issues in api_report.values()) +
-                       sum(len(issues) for issues in db_report.values()))
-        total_files = len(model_report) + len(api_report) + len(db_report)
-
-        f.write("## Summary\n\n")
-        f.write(f"- **Total Files Analyzed**: {total_files}\n")
-        f.write(f"- **Total Issues Found**: {total_issues}\n")
-        f.write(f"- **Structure Issues**: {len(structure_issues)}\n")
-        f.write(f"- **Model Issues**: {sum(len(issues) for issues in model_report.values())}\n")
-        f.write(f"- **API Issues**: {sum(len(issues) for issues in api_report.values())}\n")
-        f.write(f"- **Database Issues**: {sum(len(issues) for issues in db_report.values())}\n\n")
-
-        # Project structure section
-        f.write("## Project Structure Analysis\n\n")
-        if structure_issues:
-            for issue in structure_issues:
-                severity = "🔴" if "Missing" in issue and "optional" not in issue else "🟡"
-                f.write(f"{severity} {issue}\n")
-        else:
-            f.write("✅ Project structure looks good!\n")
-
-        # Model analysis section
-        f.write("\n## SQLAlchemy Model Analysis\n\n")
-        if not model_report:
-            f.write("⚠️ No model files found in the project.\n")
-        else:
-            for file_path, issues in model_report.items():
-                f.write(f"### {file_path.name}\n\n")
-                f.write(f"**File**: `{file_path}`\n\n")
-
-                if not issues:
-                    f.write("✅ No issues found.\n\n")
-                    continue
-
-                # Categorize issues
-                errors = [i for i in issues if i.startswith("❌")]
-                warnings = [i for i in issues if i.startswith("⚠️")]
-                info = [i for i in issues if i.startswith("ℹ️")]
-                success = [i for i in issues if i.startswith("✅")]
-
-                if errors:
-                    f.write("**Errors:**\n")
-                    for issue in errors:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if warnings:
-                    f.write("**Warnings:**\n")
-                    for issue in warnings:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if info:
-                    f.write("**Information:**\n")
-                    for issue in info:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if success:
-                    f.write("**Passed Checks:**\n")
-                    for issue in success:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-        # API analysis section
-        f.write("\n## API Pattern Analysis\n\n")
-        if not api_report:
-            f.write("ℹ️ No API patterns analyzed or found.\n")
-        else:
-            for file_path, issues in api_report.items():
-                # Handle both Path objects and special keys
-                if isinstance(file_path, Path):
-                    section_name = file_path.name
-                    file_display = f"`{file_path}`"
-                else:
-                    section_name = str(file_path)
-                    file_display = section_name
-                
-                f.write(f"### {section_name}\n\n")
-                f.write(f"**Analysis**: {file_display}\n\n")
-
-                if not issues:
-                    f.write("✅ No issues found.\n\n")
-                    continue
-
-                # Categorize API issues
-                errors = [i for i in issues if i.startswith("❌")]
-                warnings = [i for i in issues if i.startswith("⚠️")]
-                security = [i for i in issues if i.startswith("🔐") or i.startswith("🛡️")]
-                recommendations = [i for i in issues if i.startswith("💡")]
-                success = [i for i in issues if i.startswith("✅")]
-
-                if errors:
-                    f.write("**Errors:**\n")
-                    for issue in errors:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if warnings:
-                    f.write("**Warnings:**\n")
-                    for issue in warnings:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if security:
-                    f.write("**Security & Best Practices:**\n")
-                    for issue in security:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if recommendations:
-                    f.write("**Recommendations:**\n")
-                    for issue in recommendations:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if success:
-                    f.write("**Passed Checks:**\n")
-                    for issue in success:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-        # Database analysis section
-        f.write("\n## Database Analysis\n\n")
-        if not db_report:
-            f.write("ℹ️ No database patterns analyzed or found.\n")
-        else:
-            for file_path, issues in db_report.items():
-                # Handle both Path objects and special keys
-                if isinstance(file_path, Path):
-                    section_name = file_path.name
-                    file_display = f"`{file_path}`"
-                else:
-                    section_name = str(file_path)
-                    file_display = section_name
-                
-                f.write(f"### {section_name}\n\n")
-                f.write(f"**Analysis**: {file_display}\n\n")
-
-                if not issues:
-                    f.write("✅ No issues found.\n\n")
-                    continue
-
-                # Categorize database issues
-                errors = [i for i in issues if i.startswith("❌")]
-                warnings = [i for i in issues if i.startswith("⚠️")]
-                security = [i for i in issues if i.startswith("🔐")]
-                recommendations = [i for i in issues if i.startswith("💡")]
-                info = [i for i in issues if i.startswith("ℹ️")]
-                success = [i for i in issues if i.startswith("✅")]
-
-                if errors:
-                    f.write("**Errors:**\n")
-                    for issue in errors:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if warnings:
-                    f.write("**Warnings:**\n")
-                    for issue in warnings:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if security:
-                    f.write("**Security:**\n")
-                    for issue in security:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if recommendations:
-                    f.write("**Recommendations:**\n")
-                    for issue in recommendations:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if info:
-                    f.write("**Information:**\n")
-                    for issue in info:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-                if success:
-                    f.write("**Passed Checks:**\n")
-                    for issue in success:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-
-        # Recommendations section
-        f.write("## Overall Recommendations\n\n")
-        f.write(_generate_recommendations(structure_issues, model_report, api_report, db_report))
+    # The report is built in memory and written with a single call
+    parts: List[str] = []
+    append = parts.append
+
+    append("# Flask Project Review Report\n\n")
+    if generated_at is None:
+        generated_at = datetime.now()
+    append(f"Generated on: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+    # Summary section
+    model_issue_count = sum(map(len, model_report.values()))
+    api_issue_count = sum(map(len, api_report.values()))
+    db_issue_count = sum(map(len, db_report.values()))
+    total_issues = len(structure_issues) + model_issue_count + api_issue_count + db_issue_count
+    total_files = len(model_report) + len(api_report) + len(db_report)
+
+    append("## Summary\n\n")
+    append(f"- **Total Files Analyzed**: {total_files}\n")
+    append(f"- **Total Issues Found**: {total_issues}\n")
+    append(f"- **Structure Issues**: {len(structure_issues)}\n")
+    append(f"- **Model Issues**: {model_issue_count}\n")
+    append(f"- **API Issues**: {api_issue_count}\n")
+    append(f"- **Database Issues**: {db_issue_count}\n\n")
+
+    # Project structure section
+    append("## Project Structure Analysis\n\n")
+    if structure_issues:
+        for issue in structure_issues:
+            severity = "🔴" if "Missing" in issue and "optional" not in issue else "🟡"
+            append(severity + " " + issue + "\n")
+    else:
+        append("✅ Project structure looks good!\n")
+
+    # Model analysis section
+    append("\n## SQLAlchemy Model Analysis\n\n")
+    if not model_report:
+        append("⚠️ No model files found in the project.\n")
+    else:
+        for file_path, issues in model_report.items():
+            append(f"### {file_path.name}\n\n")
+            append(f"**File**: `{file_path}`\n\n")
+
+            if not issues:
+                append("✅ No issues found.\n\n")
+                continue
+
+            _append_issue_groups(parts, issues, _MODEL_ISSUE_GROUPS)
+
+    # API analysis section
+    append("\n## API Pattern Analysis\n\n")
+    if not api_report:
+        append("ℹ️ No API patterns analyzed or found.\n")
+    else:
+        for file_path, issues in api_report.items():
+            _append_analysis_heading(parts, file_path)
+
+            if not issues:
+                append("✅ No issues found.\n\n")
+                continue
+
+            _append_issue_groups(parts, issues, _API_ISSUE_GROUPS)
+
+    # Database analysis section
+    append("\n## Database Analysis\n\n")
+    if not db_report:
+        append("ℹ️ No database patterns analyzed or found.\n")
+    else:
+        for file_path, issues in db_report.items():
+            _append_analysis_heading(parts, file_path)
+
+            if not issues:
+                append("✅ No issues found.\n\n")
+                continue
+
+            _append_issue_groups(parts, issues, _DATABASE_ISSUE_GROUPS)
+
+    # Recommendations section
+    append("## Overall Recommendations\n\n")
+    append(_generate_recommendations(structure_issues, model_report, api_report, db_report))
+
+    # Encoded once and written as bytes, skipping the text layer's encoder
+    report_path.write_bytes("".join(parts).encode("utf-8"))
 
     return report_path
 
 
+def _append_analysis_heading(parts: List[str], file_path: Path) -> None:
+    """Add the heading for an API or database report entry."""
+    # Handle both Path objects and special keys
+    if isinstance(file_path, Path):
+        section_name = file_path.name
+        file_display = f"`{file_path}`"
+    else:
+        section_name = str(file_path)
+        file_display = section_name
+
+    parts.append(f"### {section_name}\n\n")
+    parts.append(f"**Analysis**: {file_display}\n\n")
+
+
+def _append_issue_groups(
+    parts: List[str], issues: List[str], groups: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> None:
+    """Add a file's issues grouped by category, sorting them in one pass."""
+    bucket_for_prefix, prefix_lengths, headings = _prefix_buckets(groups)
+    grouped: List[List[str]] = [[] for _ in groups]
+    for issue in issues:
+        # Prefixes are distinct, so at most one lookup can match
+        for length in prefix_lengths:
+            index = bucket_for_prefix.get(issue[:length])
+            if index is not None:
+                grouped[index].append(issue)
+                break
+
+    for heading, bucket in zip(headings, grouped):
+        if bucket:
+            # One joined string per category rather than one part per issue
+            parts.append(heading + _ISSUE_SEPARATOR.join(bucket) + "\n\n")
+
+
+@lru_cache(maxsize=8)
+def _prefix_buckets(
+    groups: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> Tuple[Dict[str, int], Tuple[int, ...], Tuple[str, ...]]:
+    """
+    Map each issue prefix in a group table to its category.
+
+    Also returns the prefix lengths to try and each category's rendered heading,
+    which already opens the first list item.
+    """
+    bucket_for_prefix = {
+        prefix: index for index, (_, prefixes) in enumerate(groups) for prefix in prefixes
+    }
+    prefix_lengths = tuple(sorted({len(prefix) for prefix in bucket_for_prefix}))
+    headings = tuple(f"**{heading}:**{_ISSUE_SEPARATOR}" for heading, _ in groups)
+    return bucket_for_prefix, prefix_lengths, headings
+
+
+def _json_file_section(report: Dict[Path, List[str]]) -> Tuple[Dict[str, List[str]], int, int]:
+    """
+    Key a report by path strings for JSON, counting its files with issues and its issues.
+
+    Neither JSON encoder accepts Path keys, so the conversion is done here in the
+    same pass as the summary counts. Issue lists are shared, not copied.
+    """
+    files = {}
+    files_with_issues = 0
+    issue_count = 0
+    for file_path, issues in report.items():
+        files[str(file_path)] = issues
+        if issues:
+            files_with_issues += 1
+            issue_count += len(issues)
+    return files, files_with_issues, issue_count
+
+
 def write_json_report(
     output_path: Path, 
     structure_issues: List[str], 
     model_report: Dict[Path, List[str]],
     api_report: Dict[Path, List[str]] = None,
-    db_report: Dict[Path, List[str]] = None
+    db_report: Dict[Path, List[str]] = None,
+    generated_at: Optional[datetime] = None
 ) -> Path:
-    """Write a JSON report for programmatic consumption."""
+    """Write a JSON report for programmatic consumption, timestamped like write_markdown_report."""
     if api_report is None:
         api_report = {}
     if db_report is None:
@@ -235,25 +277,14 @@ def write_json_report(
         
     report_path = output_path / "freview_report.json"
 
-    # Convert Path objects to strings for JSON serialization
-    serializable_model_report = {
-        str(file_path): issues for file_path, issues in model_report.items()
-    }
-    serializable_api_report = {
-        str(file_path): issues for file_path, issues in api_report.items()
-    }
-    serializable_db_report = {
-        str(file_path): issues for file_path, issues in db_report.items()
-    }
-
-    total_issues = (len(structure_issues) + 
-                   sum(len(issues) for issues in model_report.values()) +
-                   sum(len(issues) for issues in api_report.values()) +
-                   sum(len(issues) for issues in db_report.values()))
+    model_files, model_files_with_issues, model_issue_count = _json_file_section(model_report)
+    api_files, api_files_with_issues, api_issue_count = _json_file_section(api_report)
+    db_files, db_files_with_issues, db_issue_count = _json_file_section(db_report)
+    total_issues = len(structure_issues) + model_issue_count + api_issue_count + db_issue_count
 
     report_data = {
         "metadata": {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": (generated_at or datetime.now()).isoformat(),
             "tool_version": "1.0.0",
             "total_files_analyzed": len(model_report) + len(api_report) + len(db_report),
             "total_issues": total_issues,
@@ -263,30 +294,33 @@ def write_json_report(
             "status": "passed" if not structure_issues else "failed",
         },
         "model_analysis": {
-            "files": serializable_model_report,
+            "files": model_files,
             "summary": {
-                "files_with_issues": len([f for f, issues in model_report.items() if issues]),
-                "total_model_issues": sum(len(issues) for issues in model_report.values()),
+                "files_with_issues": model_files_with_issues,
+                "total_model_issues": model_issue_count,
             },
         },
         "api_analysis": {
-            "files": serializable_api_report,
+            "files": api_files,
             "summary": {
-                "files_with_issues": len([f for f, issues in api_report.items() if issues]),
-                "total_api_issues": sum(len(issues) for issues in api_report.values()),
+                "files_with_issues": api_files_with_issues,
+                "total_api_issues": api_issue_count,
             },
         },
         "database_analysis": {
-            "files": serializable_db_report,
+            "files": db_files,
             "summary": {
-                "files_with_issues": len([f for f, issues in db_report.items() if issues]),
-                "total_database_issues": sum(len(issues) for issues in db_report.values()),
+                "files_with_issues": db_files_with_issues,
+                "total_database_issues": db_issue_count,
             },
         },
     }
 
-    with report_path.open("w") as f:
-        json.dump(report_data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        report_path.write_bytes(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+    else:
+        text = json.dumps(report_data, indent=2, ensure_ascii=False)
+        report_path.write_bytes(text.encode("utf-8"))
 
     return report_path
 
@@ -303,135 +337,27 @@ def _generate_recommendations(
     if db_report is None:
         db_report = {}
         
-    recommendations = []
-
-    # Structure recommendations
-    if any("Missing entry file" in issue for issue in structure_issues):
-        recommendations.append(
-            "- Create a main application entry point (app.py, run.py, or main.py) to bootstrap your Flask application."
-        )
-
-    if any("Missing 'models/'" in issue for issue in structure_issues):
-        recommendations.append(
-            "- Create a dedicated 'models/' directory to organize your SQLAlchemy models."
-        )
-
-    if any("configuration file" in issue for issue in structure_issues):
-        recommendations.append(
-            "- Add configuration management with either a config.py file or .env file for environment variables."
-        )
-
-    # Model recommendations
-    has_missing_tablename = any(
-        any("Missing __tablename__" in issue for issue in issues)
-        for issues in model_report.values()
-    )
-    if has_missing_tablename:
-        recommendations.append(
-            "- Add __tablename__ attribute to all SQLAlchemy models to explicitly define table names."
-        )
-
-    has_missing_pk = any(
-        any("No primary key defined" in issue for issue in issues)
-        for issues in model_report.values()
-    )
-    if has_missing_pk:
-        recommendations.append(
-            "- Ensure all models have a primary key field, typically an 'id' column with primary_key=True."
-        )
-
-    has_circular_imports = any(
-        any("Circular import detected" in issue for issue in issues)
-        for issues in model_report.values()
-    )
-    if has_circular_imports:
-        recommendations.append(
-            "- Resolve circular imports by using string-based relationship definitions or restructuring your models."
-        )
-
-    # API recommendations
-    has_missing_auth = any(
-        any("may need authentication" in issue for issue in issues)
-        for issues in api_report.values()
-    )
-    if has_missing_auth:
-        recommendations.append(
-            "- Implement authentication for sensitive API endpoints using Flask-Login, JWT, or similar."
-        )
-
-    has_missing_validation = any(
-        any("should validate input" in issue for issue in issues)
-        for issues in api_report.values()
-    )
-    if has_missing_validation:
-        recommendations.append(
-            "- Add input validation to API endpoints using Flask-WTF, marshmallow, or similar libraries."
-        )
-
-    has_missing_error_handling = any(
-        any("should include error handling" in issue for issue in issues)
-        for issues in api_report.values()
-    )
-    if has_missing_error_handling:
-        recommendations.append(
-            "- Implement proper error handling in API routes with try-catch blocks and meaningful error responses."
-        )
-
-    has_versioning_suggestion = any(
-        any("Consider API versioning" in issue for issue in issues)
-        for issues in api_report.values()
-    )
-    if has_versioning_suggestion:
-        recommendations.append(
-            "- Implement API versioning (e.g., /api/v1/) for better API evolution and backward compatibility."
-        )
-
-    # Database recommendations
-    has_migration_issues = any(
-        any("No migrations directory found" in issue for issue in issues)
-        for issues in db_report.values()
-    )
-    if has_migration_issues:
-        recommendations.append(
-            "- Set up database migrations with Flask-Migrate: pip install Flask-Migrate && flask db init"
-        )
-
-    has_config_issues = any(
-        any("No database configuration found" in issue for issue in issues)
-        for issues in db_report.values()
-    )
-    if has_config_issues:
-        recommendations.append(
-            "- Configure database connection in config.py with SQLALCHEMY_DATABASE_URI."
-        )
-
-    has_security_issues = any(
-        any("hardcoded database credentials" in issue for issue in issues)
-        for issues in db_report.values()
-    )
-    if has_security_issues:
-        recommendations.append(
-            "- Move database credentials to environment variables for security."
-        )
-
-    has_n_plus_one = any(
-        any("N+1 query problem" in issue for issue in issues)
-        for issues in db_report.values()
-    )
-    if has_n_plus_one:
-        recommendations.append(
-            "- Optimize database queries by using joins and eager loading to avoid N+1 query problems."
-        )
-
-    # General recommendations
-    recommendations.extend(
-        [
-            "- Consider using Flask-Migrate for database migrations.",
-            "- Implement model validation using SQLAlchemy validators or Flask-WTF.",
-            "- Add comprehensive docstrings to your models and methods.",
-            "- Consider implementing model mixins for common functionality (timestamps, soft deletes, etc.).",
-        ]
-    )
+    # Each report's issues are joined once, so every check below is a single
+    # substring search; no marker spans a newline, so matches stay per issue
+    structure_text = "\n".join(structure_issues)
+    model_text = "\n".join(chain.from_iterable(model_report.values()))
+    api_text = "\n".join(chain.from_iterable(api_report.values()))
+    db_text = "\n".join(chain.from_iterable(db_report.values()))
+
+    texts = (structure_text, model_text, api_text, db_text)
+    flags = tuple(marker in texts[source] for source, marker, _ in _RECOMMENDATIONS)
+    return _recommendations_from_flags(flags)
+
+
+@lru_cache(maxsize=128)
+def _recommendations_from_flags(flags: Tuple[bool, ...]) -> str:
+    """Render the recommendations whose markers were found, memoized per flag set."""
+    recommendations = [
+        recommendation
+        for found, (_, _, recommendation) in zip(flags, _RECOMMENDATIONS)
+        if found
+    ]
+    recommendations.extend(_GENERAL_RECOMMENDATIONS)
 
     return (
         "\n".join(recommendations)
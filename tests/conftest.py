@@ -2,19 +2,27 @@
 Test configuration and fixtures for freview tests.
 """
 
+import shutil
 import pytest
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from tempfile import mkdtemp
 from freview.config import ReviewConfig
 
 
+@pytest.fixture(scope="session")
+def projects_root(tmp_path_factory):
+    """Create one base directory for the session's test projects, removed at the end."""
+    root = tmp_path_factory.mktemp("projects")
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
 @pytest.fixture
-def temp_project():
-    """Create a temporary project directory for testing."""
-    with TemporaryDirectory() as temp_dir:
-        project_path = Path(temp_dir) / "test_project"
-        project_path.mkdir()
-        yield project_path
+def temp_project(projects_root):
+    """Create a temporary project directory for testing in its own subdirectory."""
+    project_path = Path(mkdtemp(dir=projects_root)) / "test_project"
+    project_path.mkdir()
+    return project_path
 
 
 @pytest.fixture
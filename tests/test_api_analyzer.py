@@ -3,7 +3,7 @@ Tests for API analysis functionality.
 """
 
 from pathlib import Path
-from freview.api_analyzer import analyze_api_patterns, APIVisitor
+from freview.api_analyzer import analyze_api_patterns, APIVisitor, RouteInfo
 import ast
 
 
@@ -43,11 +43,7 @@ if __name__ == '__main__':
     assert len(results) >= 1
     
     # Should find routes
-    app_py_results = None
-    for file_path, issues in results.items():
-        if isinstance(file_path, Path) and file_path.name == "app.py":
-            app_py_results = issues
-            break
+    app_py_results = results.get(temp_project / "app.py")
     
     assert app_py_results is not None
     
@@ -88,11 +84,7 @@ def logout():
     assert len(results) >= 1
     
     # Should find issues
-    blueprint_results = None
-    for file_path, issues in results.items():
-        if isinstance(file_path, Path) and "auth_bp.py" in str(file_path):
-            blueprint_results = issues
-            break
+    blueprint_results = results.get(blueprints_dir / "auth_bp.py")
     
     assert blueprint_results is not None
     
@@ -157,6 +149,7 @@ def test_route():
     assert 'GET' in route.methods
     assert 'POST' in route.methods
     assert route.has_docstring
+    assert route.decorators == ["api_bp.route(...)"]
 
     # Should find one blueprint
     assert len(visitor.blueprints) == 1
@@ -165,6 +158,58 @@ def test_route():
     assert blueprint.url_prefix == '/api'
 
 
+def test_api_visitor_route_body_patterns():
+    """Test that route body patterns are attributed to the enclosing route."""
+    code = """
+from flask import Flask, request
+
+app = Flask(__name__)
+
+@app.route('/items', methods=['POST'])
+def create_item():
+    try:
+        data = request.get_json()
+        verify_token()
+    except ValueError:
+        pass
+    return "OK"
+
+@app.route('/health')
+def health():
+    return "OK"
+"""
+
+    visitor = APIVisitor(Path("test.py"))
+    visitor.visit(ast.parse(code))
+
+    assert len(visitor.routes) == 2
+    create_item, health = visitor.routes
+    assert create_item.has_error_handling
+    assert create_item.has_input_validation
+    assert create_item.has_authentication
+    assert not health.has_error_handling
+    assert not health.has_input_validation
+    assert not health.has_authentication
+
+
+def test_api_visitor_async_route():
+    """Test that async view functions are detected as routes."""
+    code = """
+from flask import Flask
+
+app = Flask(__name__)
+
+@app.route('/async')
+async def async_view():
+    return "OK"
+"""
+
+    visitor = APIVisitor(Path("test.py"))
+    visitor.visit(ast.parse(code))
+
+    assert [route.function_name for route in visitor.routes] == ["async_view"]
+
+
 def test_no_api_routes_found(temp_project):
     """Test behavior when no API routes are found."""
     # Create a file without routes
@@ -183,3 +228,11 @@ class User(db.Model):
     assert len(results) == 1
     issues = list(results.values())[0]
     assert any("No Flask route files found" in issue for issue in issues)
+
+
+def test_route_method_set_follows_methods():
+    """Test that the method set reflects later changes to the methods list."""
+    route = RouteInfo(name="items", path="/items", methods=["GET"], function_name="items")
+    route.methods.append("POST")
+
+    assert route.method_set == frozenset({"GET", "POST"})
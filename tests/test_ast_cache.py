@@ -0,0 +1,123 @@
+"""
+Tests for shared AST parsing.
+"""
+
+import ast
+import os
+import pytest
+from freview._ast_cache import (
+    CompositeVisitor,
+    clear_caches,
+    file_observers,
+    parsed_tree,
+    is_decode_error,
+)
+
+
+def test_parsed_tree_is_reused(temp_project):
+    """Test that repeated parses of an unchanged file share one tree."""
+    source = temp_project / "app.py"
+    source.write_text("x = 1\n")
+
+    assert parsed_tree(source) is parsed_tree(source)
+
+
+def test_parsed_tree_sees_changes(temp_project):
+    """Test that a modified file is parsed again."""
+    source = temp_project / "app.py"
+    source.write_text("x = 1\n")
+    first = parsed_tree(source)
+
+    source.write_text("x = 1\ny = 2\n")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = parsed_tree(source)
+    assert second is not first
+    assert len(second.body) == 2
+
+
+def test_clear_caches(temp_project):
+    """Test that clearing the caches forces a fresh parse."""
+    source = temp_project / "app.py"
+    source.write_text("x = 1\n")
+    first = parsed_tree(source)
+
+    clear_caches()
+
+    assert parsed_tree(source) is not first
+
+
+def test_parsed_tree_decode_error(temp_project):
+    """Test that undecodable source is reported as a decode error."""
+    source = temp_project / "broken.py"
+    source.write_bytes(b"\xff\xfe x = 1\n")
+
+    with pytest.raises(SyntaxError) as exc_info:
+        parsed_tree(source)
+
+    assert is_decode_error(exc_info.value)
+
+
+def test_file_observers_share_one_walk(temp_project):
+    """Test that every analyzer's visitor is built from the same walk."""
+    # Importing the analyzers registers their observers
+    import freview.api_analyzer  # noqa: F401
+    import freview.database_analyzer  # noqa: F401
+    import freview.model_checker  # noqa: F401
+
+    source = temp_project / "app.py"
+    source.write_text(
+        """
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+app = Flask(__name__)
+db = SQLAlchemy(app)
+
+class User(db.Model):
+    __tablename__ = 'users'
+    id = db.Column(db.Integer, primary_key=True)
+
+@app.route('/users', methods=['POST'])
+def create_user():
+    try:
+        db.session.add(User())
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+    return "OK"
+"""
+    )
+
+    observers = file_observers(source)
+
+    assert observers is file_observers(source)
+    assert [route.function_name for route in observers["api"].routes] == ["create_user"]
+    assert observers["api"].routes[0].has_error_handling
+    assert [model.name for model in observers["models"].models] == ["User"]
+    assert "db.session.commit" in observers["database"].transactions
+
+
+def test_composite_visitor_skips_unwanted_expressions():
+    """Test that expressions are walked only while some observer wants them."""
+
+    class CallCounter:
+        def __init__(self, wants):
+            self.calls = []
+            if wants is not None:
+                self.wants_expressions = lambda: wants
+
+        def visit_Call(self, node):
+            self.calls.append(node)
+
+    tree = ast.parse("x = f()\nif x:\n    g()\n")
+
+    statements_only = CallCounter(False)
+    CompositeVisitor([statements_only]).visit(tree)
+    assert statements_only.calls == []
+
+    always, never = CallCounter(None), CallCounter(False)
+    CompositeVisitor([always, never]).visit(tree)
+    assert len(always.calls) == 2
+    assert len(never.calls) == 2
@@ -0,0 +1,77 @@
+"""
+Tests for configuration helpers.
+"""
+
+import os
+
+from freview.config import ReviewConfig, get_effective_model_dirs, iter_py_files, load_config
+
+
+def test_iter_py_files(temp_project):
+    """Test recursive discovery of Python files with exclusions."""
+    (temp_project / "app.py").write_text("")
+    (temp_project / "README.md").write_text("")
+    (temp_project / "pkg" / "sub").mkdir(parents=True)
+    (temp_project / "pkg" / "views.py").write_text("")
+    (temp_project / "pkg" / "sub" / "test_views.py").write_text("")
+    (temp_project / "__pycache__").mkdir()
+    (temp_project / "__pycache__" / "app.py").write_text("")
+
+    found = {p.relative_to(temp_project).as_posix() for p in iter_py_files(temp_project)}
+    assert found == {"app.py", "pkg/views.py", "pkg/sub/test_views.py", "__pycache__/app.py"}
+
+    found = {
+        p.relative_to(temp_project).as_posix()
+        for p in iter_py_files(temp_project, ("__pycache__", "test_*"))
+    }
+    assert found == {"app.py", "pkg/views.py"}
+
+
+def test_config_regexes_are_compiled_once():
+    """Test naming regexes are reused and follow pattern changes."""
+    config = ReviewConfig()
+    assert config.class_name_regex is config.class_name_regex
+    assert config.class_name_regex.match("User")
+
+    config.class_name_pattern = r"^[a-z]+$"
+    assert config.class_name_regex.match("user")
+    assert not config.class_name_regex.match("User")
+
+
+def test_load_config(temp_project):
+    """Test loading settings from .freview.toml."""
+    assert load_config(temp_project) == ReviewConfig()
+
+    config_file = temp_project / ".freview.toml"
+    config_file.write_text("")
+    assert load_config(temp_project) == ReviewConfig()
+
+    config_file.write_text('[freview]\nmodel_dirs = ["db"]\nunknown = 1\n')
+    config = load_config(temp_project)
+    assert config.model_dirs == ["db"]
+
+    # Callers get independent copies
+    config.model_dirs.append("other")
+    assert load_config(temp_project).model_dirs == ["db"]
+
+    # Edits are picked up
+    config_file.write_text('[freview]\nmax_issues_per_file = 5\n')
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    config = load_config(temp_project)
+    assert config.max_issues_per_file == 5
+    assert config.model_dirs == ReviewConfig().model_dirs
+
+
+def test_get_effective_model_dirs(temp_project):
+    """Test only existing model directories are returned, in configured order."""
+    (temp_project / "app" / "models").mkdir(parents=True)
+    (temp_project / "models").mkdir()
+    (temp_project / "src").mkdir()
+    (temp_project / "src" / "models").write_text("")
+
+    config = ReviewConfig(model_dirs=["models", "app/models", "src/models", "lib/models"])
+    assert get_effective_model_dirs(config, temp_project) == [
+        temp_project / "models",
+        temp_project / "app" / "models",
+    ]
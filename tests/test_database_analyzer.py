@@ -3,7 +3,13 @@ Tests for database analysis functionality.
 """
 
 from pathlib import Path
-from freview.database_analyzer import analyze_database_patterns
+import ast
+
+from freview.database_analyzer import (
+    DatabaseVisitor,
+    analyze_database_patterns,
+    _analyze_migration_file,
+)
 
 
 def test_analyze_migrations(temp_project):
@@ -95,11 +101,7 @@ class Config:
     assert len(results) >= 1
     
     # Should find good configuration practices
-    config_results = None
-    for file_path, issues in results.items():
-        if isinstance(file_path, Path) and file_path.name == "config.py":
-            config_results = issues
-            break
+    config_results = results.get(temp_project / "config.py")
     
     assert config_results is not None
     
@@ -122,11 +124,7 @@ class Config:
     results = analyze_database_patterns(temp_project)
     
     # Should find issues
-    config_results = None
-    for file_path, issues in results.items():
-        if isinstance(file_path, Path) and file_path.name == "config.py":
-            config_results = issues
-            break
+    config_results = results.get(temp_project / "config.py")
     
     assert config_results is not None
     
@@ -256,3 +254,68 @@ db = SQLAlchemy(app)
     
     assert migration_recommendations is not None
     assert any("No migrations directory found" in issue for issue in migration_recommendations)
+
+
+def test_database_usage_skips_environment_dirs(temp_project):
+    """Test that virtualenv and dependency directories are not analyzed."""
+    (temp_project / "services.py").write_text("db.session.commit()\n")
+    for skipped in (".venv", "node_modules"):
+        package_dir = temp_project / skipped / "pkg"
+        package_dir.mkdir(parents=True)
+        (package_dir / "orm.py").write_text("db.session.commit()\n")
+
+    results = analyze_database_patterns(temp_project)
+
+    assert temp_project / "services.py" in results
+    assert not any(".venv" in p.parts or "node_modules" in p.parts for p in results)
+    usage = results[temp_project / "DATABASE_USAGE"]
+    assert "✅ Database usage detected in 1 file(s)" in usage
+
+
+def test_migration_alter_column_not_null(temp_project):
+    """Test that alter_column is only flagged when it sets nullable=False on the same line."""
+    flagged = temp_project / "002_flagged.py"
+    flagged.write_text(
+        "def upgrade():\n"
+        "    op.alter_column('users', 'bio', nullable=True); "
+        "op.alter_column('users', 'email', nullable=False)\n"
+        "def downgrade():\n"
+        "    pass\n"
+    )
+    safe = temp_project / "003_safe.py"
+    safe.write_text(
+        "def upgrade():\n"
+        "    op.alter_column('users', 'email')\n"
+        "    sa.Column('name', nullable=False)\n"
+        "def downgrade():\n"
+        "    pass\n"
+    )
+
+    dangerous = "contains potentially dangerous operation: alter_column"
+    assert any(dangerous in issue for issue in _analyze_migration_file(flagged))
+    assert not any(dangerous in issue for issue in _analyze_migration_file(safe))
+
+
+def test_database_visitor_config_items():
+    """Test that only module and class level settings are collected."""
+    tree = ast.parse(
+        """
+DATABASE_URI = "sqlite:///app.db"
+
+class Config:
+    SQLALCHEMY_POOL_SIZE = 5
+
+def connect():
+    db_name = "scratch"
+    return db.session.execute("SELECT 1")
+"""
+    )
+
+    visitor = DatabaseVisitor(Path("config.py"))
+    visitor.visit(tree)
+
+    assert visitor.config_items == {
+        "DATABASE_URI": "sqlite:///app.db",
+        "SQLALCHEMY_POOL_SIZE": "5",
+    }
+    assert "db.session.execute" in visitor.query_patterns
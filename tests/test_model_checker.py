@@ -3,8 +3,14 @@ Tests for model analysis functionality.
 """
 
 from pathlib import Path
-from freview.model_checker import analyze_models, ModelVisitor
+from freview.model_checker import (
+    analyze_models,
+    ModelVisitor,
+    _find_model_files,
+    _strongly_connected_components,
+)
 import ast
+import json
 
 
 def test_analyze_good_model(temp_project):
@@ -110,3 +116,178 @@ def test_no_models_found(temp_project):
     assert len(results) == 1
     issues = list(results.values())[0]
     assert any("No Python model files found" in issue for issue in issues)
+
+
+def test_unused_models_across_files(temp_project):
+    """Test relationships resolve across files and unused models stay in their own file."""
+    models_dir = temp_project / "models"
+    models_dir.mkdir()
+
+    header = "from flask_sqlalchemy import SQLAlchemy\n\ndb = SQLAlchemy()\n"
+    (models_dir / "author.py").write_text(
+        header
+        + """
+class Author(db.Model):
+    __tablename__ = 'authors'
+    id = db.Column(db.Integer, primary_key=True)
+    books = db.relationship('Book', back_populates='author')
+"""
+    )
+    (models_dir / "book.py").write_text(
+        header
+        + """
+class Book(db.Model):
+    __tablename__ = 'books'
+    id = db.Column(db.Integer, primary_key=True)
+    author = db.relationship('Author', back_populates='books')
+"""
+    )
+    (models_dir / "audit.py").write_text(
+        header
+        + """
+class AuditLog(db.Model):
+    __tablename__ = 'audit_logs'
+    id = db.Column(db.Integer, primary_key=True)
+"""
+    )
+
+    results = analyze_models(temp_project)
+
+    unused = [
+        issue for issues in results.values() for issue in issues if "is not referenced" in issue
+    ]
+    assert unused == ["⚠️ Model 'AuditLog' is not referenced in any relationships"]
+    assert unused[0] in results[models_dir / "audit.py"]
+
+
+def test_strongly_connected_components():
+    """Test cycle grouping, including cycles longer than two models."""
+    graph = {
+        "A": ["B"],
+        "B": ["C", "Missing"],
+        "C": ["A"],
+        "D": ["A"],
+        "E": ["F"],
+        "F": ["E"],
+    }
+
+    components = _strongly_connected_components(graph)
+
+    assert sorted(components) == [["A", "B", "C"], ["D"], ["E", "F"]]
+
+
+def test_circular_relationships_reported_once(temp_project):
+    """Test that a relationship cycle across several files is reported once."""
+    models_dir = temp_project / "models"
+    models_dir.mkdir()
+
+    for i in range(4):
+        (models_dir / f"model_{i}.py").write_text(
+            f"""
+from flask_sqlalchemy import SQLAlchemy
+
+db = SQLAlchemy()
+
+class Model{i}(db.Model):
+    __tablename__ = 'model_{i}'
+    id = db.Column(db.Integer, primary_key=True)
+    related = db.relationship('Model{(i + 1) % 4}')
+"""
+        )
+
+    results = analyze_models(temp_project)
+
+    cycles = [
+        issue for issues in results.values() for issue in issues if "circular relationship" in issue
+    ]
+    assert cycles == [
+        "⚠️ Potential circular relationship among 'Model0', 'Model1', 'Model2', 'Model3'"
+    ]
+    assert cycles[0] in results[models_dir / "model_0.py"]
+
+
+def test_find_model_files_sees_new_files(temp_project):
+    """Test that cached model file searches pick up added files."""
+    models_dir = temp_project / "models"
+    models_dir.mkdir()
+    (models_dir / "__init__.py").write_text("")
+    (models_dir / "user.py").write_text("")
+
+    assert _find_model_files(temp_project) == [models_dir / "user.py"]
+
+    (models_dir / "post.py").write_text("")
+    (temp_project / "models.py").write_text("")
+
+    assert sorted(_find_model_files(temp_project)) == [
+        models_dir / "post.py",
+        models_dir / "user.py",
+        temp_project / "models.py",
+    ]
+
+
+def test_analyze_models_cache(temp_project):
+    """Test that cached results are reused for unchanged files and refreshed on edits."""
+    models_dir = temp_project / "models"
+    models_dir.mkdir()
+    user_file = models_dir / "user.py"
+    user_file.write_text(
+        """
+from flask_sqlalchemy import SQLAlchemy
+
+db = SQLAlchemy()
+
+class User(db.Model):
+    __tablename__ = 'users'
+    id = db.Column(db.Integer, primary_key=True)
+"""
+    )
+    cache_dir = temp_project / ".freview_cache"
+
+    first = analyze_models(temp_project, cache_dir=cache_dir)
+    assert (cache_dir / "models.json").exists()
+
+    second = analyze_models(temp_project, cache_dir=cache_dir)
+    assert second == first
+
+    user_file.write_text(user_file.read_text().replace("__tablename__ = 'users'\n", ""))
+    third = analyze_models(temp_project, cache_dir=cache_dir)
+    assert "❌ User: Missing __tablename__ attribute" in third[user_file]
+
+
+def test_analyze_models_corrupted_cache(temp_project):
+    """Test that malformed cache contents are treated as misses and rewritten."""
+    models_dir = temp_project / "models"
+    models_dir.mkdir()
+    user_file = models_dir / "user.py"
+    user_file.write_text(
+        """
+from flask_sqlalchemy import SQLAlchemy
+
+db = SQLAlchemy()
+
+class User(db.Model):
+    __tablename__ = 'users'
+    id = db.Column(db.Integer, primary_key=True)
+"""
+    )
+    cache_dir = temp_project / ".freview_cache"
+    cache_file = cache_dir / "models.json"
+    expected = analyze_models(temp_project, cache_dir=cache_dir)
+    valid = json.loads(cache_file.read_text())
+    entry = valid["files"][str(user_file)]
+
+    corruptions = [
+        {"files": []},
+        {"files": {str(user_file): "not an entry"}},
+        {"files": {str(user_file): {**entry, "mtime_ns": str(entry["mtime_ns"])}}},
+        {"files": {str(user_file): {**entry, "size": None}}},
+        {"files": {str(user_file): {**entry, "models": {}}}},
+        {"files": {str(user_file): {**entry, "issues": 1}}},
+        {"files": {str(user_file): {**entry, "models": ["User"]}}},
+        {"files": {str(user_file): {**entry, "models": [{"unknown": 1}]}}},
+    ]
+    for corruption in corruptions:
+        cache_file.write_text(json.dumps({**valid, **corruption}))
+
+        assert analyze_models(temp_project, cache_dir=cache_dir) == expected
+        assert json.loads(cache_file.read_text()) == valid
@@ -3,7 +3,7 @@ Tests for project structure analysis.
 """
 
 import pytest
-from freview.project_analyzer import analyze_project_structure
+from freview.project_analyzer import analyze_project_structure, get_project_info
 
 
 def test_analyze_complete_project(sample_flask_project):
@@ -69,3 +69,29 @@ def test_analyze_blueprint_structure(temp_project):
 
     # Should still work with blueprint structure
     assert isinstance(issues, list)
+
+
+def test_get_project_info_detects_flask(temp_project):
+    """Test Flask import detection, including files that are not valid UTF-8."""
+    (temp_project / "legacy.py").write_bytes(b"# caf\xe9\nimport os\n")
+    assert get_project_info(temp_project)["has_flask"] is False
+
+    (temp_project / "app.py").write_text("from flask import Flask\n")
+    info = get_project_info(temp_project)
+
+    assert info["has_flask"] is True
+    assert temp_project / "app.py" in info["python_files"]
+
+
+def test_analyze_dangling_symlink_is_missing(temp_project):
+    """Test that a broken symlink does not count as an existing file."""
+    (temp_project / "README.md").symlink_to(temp_project / "missing.md")
+
+    issues = analyze_project_structure(temp_project)
+
+    assert any("Missing README" in i for i in issues)
+
+    (temp_project / "missing.md").write_text("# Project\n")
+    issues = analyze_project_structure(temp_project)
+
+    assert not any("Missing README" in i for i in issues)